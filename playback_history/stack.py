@@ -6,6 +6,8 @@ class StackNode:
         song (Song): Song data stored in the node.
         next (StackNode): Reference to next node in stack.
     """
+    __slots__ = ('song', 'next')
+
     def __init__(self, song):
         self.song = song
         self.next = None
@@ -52,3 +54,12 @@ class Stack:
 
     def is_empty(self):
         return self.top is None
+
+    def __iter__(self):
+        """
+        Yield songs from the top of the stack down (most recent first).
+        """
+        node = self.top
+        while node:
+            yield node.song
+            node = node.next
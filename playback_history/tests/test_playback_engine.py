@@ -46,6 +46,17 @@ class TestStack(unittest.TestCase):
         self.stack.pop()
         self.assertIsNone(self.stack.peek())
 
+    def test_iterates_from_top(self):
+        """
+        Iterating the stack yields songs most recent first without popping them.
+        """
+        song1 = Song("Song 1", "Artist 1", 200)
+        song2 = Song("Song 2", "Artist 2", 180)
+        self.stack.push(song1)
+        self.stack.push(song2)
+        self.assertEqual(list(self.stack), [song2, song1])
+        self.assertEqual(self.stack.size, 2)
+
 class TestPlaybackHistory(unittest.TestCase):
     def setUp(self):
         """
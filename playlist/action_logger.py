@@ -4,8 +4,10 @@ Action Logger module for PlayWise Music Engine.
 Implements the Command pattern and stack-based undo functionality for playlist edits.
 """
 
-from typing import List, Any, Callable
+from typing import List, Any, Callable, Iterator, Optional
 from collections import deque
+from contextlib import contextmanager
+from itertools import islice
 
 
 class Action:
@@ -17,20 +19,28 @@ class Action:
     
     Space Complexity:
         - O(1) for the action object itself
-        - Additional space depends on the data stored in action_params
+        - Additional space depends on the data stored in action_args/action_params
+    
+    Storing the undo function together with its arguments lets callers pass a
+    plain (bound) method instead of allocating a closure per action.
     """
     
-    def __init__(self, action_type: str, undo_func: Callable, action_params: dict):
+    __slots__ = ('action_type', 'undo_func', 'action_args', 'action_params')
+    
+    def __init__(self, action_type: str, undo_func: Callable, action_args: tuple = (),
+                 action_params: Optional[dict] = None):
         """
         Initialize an action.
         
         Args:
             action_type (str): Type of action (e.g., 'add', 'delete', 'move')
             undo_func (Callable): Function to execute for undoing this action
-            action_params (dict): Parameters needed to execute the undo function
+            action_args (tuple): Positional arguments for the undo function
+            action_params (dict): Keyword arguments for the undo function
         """
         self.action_type = action_type
         self.undo_func = undo_func
+        self.action_args = action_args
         self.action_params = action_params
 
 
@@ -38,7 +48,8 @@ class ActionLogger:
     """
     Manages a stack of reversible actions for playlist edits using the Command pattern.
     
-    Uses a stack (deque with maxlen) for O(1) push/pop operations.
+    Uses a stack (deque with maxlen) for O(1) push/pop operations. The maxlen makes
+    the deque a ring buffer: logging beyond max_history evicts the oldest action in O(1).
     
     Time Complexity:
         - log_action: O(1)
@@ -59,8 +70,10 @@ class ActionLogger:
         """
         self._action_history = deque(maxlen=max_history)
         self._max_history = max_history
+        # When False, log_action is a no-op (used while replaying undos or bulk edits)
+        self._log_enabled = True
     
-    def log_action(self, action_type: str, undo_func: Callable, **kwargs) -> None:
+    def log_action(self, action_type: str, undo_func: Callable, *args, **kwargs) -> None:
         """
         Log a reversible action.
         
@@ -70,11 +83,32 @@ class ActionLogger:
         Args:
             action_type (str): Type of action (e.g., 'add', 'delete', 'move')
             undo_func (Callable): Function to execute for undoing this action
-            **kwargs: Parameters needed to execute the undo function
+            *args: Positional parameters needed to execute the undo function
+            **kwargs: Keyword parameters needed to execute the undo function
         """
-        action = Action(action_type, undo_func, kwargs)
+        if not self._log_enabled:
+            return
+        action = Action(action_type, undo_func, args, kwargs or None)
         self._action_history.append(action)
     
+    @contextmanager
+    def suppressed(self) -> Iterator[None]:
+        """
+        Context manager that disables log_action for its duration.
+        
+        Re-entrant: the previous logging state is restored on exit, so nested
+        blocks (or an exception inside the block) leave logging as it was.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        """
+        previous = self._log_enabled
+        self._log_enabled = False
+        try:
+            yield
+        finally:
+            self._log_enabled = previous
+    
     def undo_last_n_actions(self, n: int) -> List[str]:
         """
         Undo the last N actions.
@@ -93,15 +127,32 @@ class ActionLogger:
         
         # Limit n to the actual number of available actions
         n = min(n, len(self._action_history))
-        
+
+        # Take the newest n actions (newest first) and trim the history in one go,
+        # before running any undo function that might log new actions
+        if n == len(self._action_history):
+            actions = list(reversed(self._action_history))
+            self._action_history.clear()
+        else:
+            actions = list(islice(reversed(self._action_history), n))
+            for _ in range(n):
+                self._action_history.pop()
+
         undone_actions = []
-        for _ in range(n):
-            if self._action_history:
-                action = self._action_history.pop()
-                # Execute the undo function with its parameters
-                action.undo_func(**action.action_params)
-                undone_actions.append(action.action_type)
-        
+        for i, action in enumerate(actions):
+            # Execute the undo function with its parameters
+            try:
+                if action.action_params:
+                    action.undo_func(*action.action_args, **action.action_params)
+                else:
+                    action.undo_func(*action.action_args)
+            except Exception:
+                # Put back the actions that have not run yet (oldest first) so a
+                # failing undo only drops its own action, then let the error through
+                self._action_history.extend(reversed(actions[i + 1:]))
+                raise
+            undone_actions.append(action.action_type)
+
         return undone_actions
     
     def get_action_history(self) -> List[str]:
@@ -150,18 +201,9 @@ class ActionLogger:
         if max_history <= 0:
             raise ValueError("max_history must be positive")
         
-        # Create a new deque with the new maxlen
-        new_history = deque(maxlen=max_history)
-        
-        # Copy existing actions, respecting the new maxlen
-        # If new maxlen is smaller, only copy the most recent actions
-        if len(self._action_history) > max_history:
-            # Keep only the most recent max_history actions
-            actions_to_keep = list(self._action_history)[-max_history:]
-            new_history.extend(actions_to_keep)
-        else:
-            # Copy all actions
-            new_history.extend(self._action_history)
+        # Rebuild the ring buffer with the new maxlen; when shrinking, deque keeps
+        # only the most recent actions (the oldest are dropped from the left)
+        new_history = deque(self._action_history, maxlen=max_history)
         
         self._action_history = new_history
         self._max_history = max_history
\ No newline at end of file
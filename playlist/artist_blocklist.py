@@ -4,18 +4,21 @@ Artist Blocklist module for PlayWise Music Engine.
 Implements a HashSet-based blocklist for permanently avoiding songs by certain artists.
 """
 
-from typing import Set
+from typing import Set, FrozenSet
+from .song import normalize_artist
 
 
 class ArtistBlocklist:
     """
     Manages a blocklist of artists that should be permanently avoided.
     
-    Uses a HashSet (Python set) for O(1) membership checking.
+    Uses a HashSet (Python set) for O(1) membership checking. Edits go to a mutable
+    set; lookups read an immutable frozenset snapshot rebuilt after each edit, since
+    the blocklist changes rarely but is queried on every song add.
     
     Time Complexity:
-        - add_artist: O(1) average case
-        - remove_artist: O(1) average case
+        - add_artist: O(n) to rebuild the lookup snapshot
+        - remove_artist: O(n) to rebuild the lookup snapshot
         - is_blocked: O(1) average case
         - get_blocked_artists: O(n) where n is the number of blocked artists
     
@@ -26,12 +29,14 @@ class ArtistBlocklist:
     def __init__(self):
         """Initialize an empty artist blocklist."""
         self._blocked_artists: Set[str] = set()
+        # Read-only snapshot queried by is_blocked / is_blocked_normalized
+        self._frozen: FrozenSet[str] = frozenset()
     
     def add_artist(self, artist: str) -> None:
         """
         Add an artist to the blocklist.
         
-        Time Complexity: O(1) average case
+        Time Complexity: O(1) average case, plus O(n) to rebuild the snapshot if the artist is new
         Space Complexity: O(1) if artist already exists, O(1) additional space if new
         
         Args:
@@ -39,13 +44,15 @@ class ArtistBlocklist:
         """
         # Normalize the artist name for consistent matching
         normalized_artist = self._normalize_artist(artist)
-        self._blocked_artists.add(normalized_artist)
+        if normalized_artist not in self._blocked_artists:
+            self._blocked_artists.add(normalized_artist)
+            self._frozen = frozenset(self._blocked_artists)
     
     def remove_artist(self, artist: str) -> bool:
         """
         Remove an artist from the blocklist.
         
-        Time Complexity: O(1) average case
+        Time Complexity: O(1) average case, plus O(n) to rebuild the snapshot if removed
         Space Complexity: O(1)
         
         Args:
@@ -57,6 +64,7 @@ class ArtistBlocklist:
         normalized_artist = self._normalize_artist(artist)
         if normalized_artist in self._blocked_artists:
             self._blocked_artists.discard(normalized_artist)
+            self._frozen = frozenset(self._blocked_artists)
             return True
         return False
     
@@ -74,7 +82,22 @@ class ArtistBlocklist:
             bool: True if artist is blocked, False otherwise
         """
         normalized_artist = self._normalize_artist(artist)
-        return normalized_artist in self._blocked_artists
+        return normalized_artist in self._frozen
+    
+    def is_blocked_normalized(self, artist_key: str) -> bool:
+        """
+        Check an already-normalized artist key (e.g. Song.artist_key) against the blocklist.
+        
+        Time Complexity: O(1) average case
+        Space Complexity: O(1)
+        
+        Args:
+            artist_key (str): Artist name normalized with normalize_artist
+            
+        Returns:
+            bool: True if artist is blocked, False otherwise
+        """
+        return artist_key in self._frozen
     
     def get_blocked_artists(self) -> Set[str]:
         """
@@ -98,9 +121,7 @@ class ArtistBlocklist:
         Returns:
             str: Normalized artist name
         """
-        if not artist:
-            return ""
-        return artist.strip().lower()
+        return normalize_artist(artist)
     
     def clear(self) -> None:
         """
@@ -109,4 +130,5 @@ class ArtistBlocklist:
         Time Complexity: O(1) amortized
         Space Complexity: O(1)
         """
-        self._blocked_artists.clear()
\ No newline at end of file
+        self._blocked_artists.clear()
+        self._frozen = frozenset()
\ No newline at end of file
@@ -4,8 +4,11 @@ Constrained Shuffle module for PlayWise Music Engine.
 Implements shuffle algorithms with constraints to prevent consecutive artists.
 """
 
+import heapq
 import random
-from typing import List, Dict
+from collections import Counter
+from itertools import islice
+from typing import List, Dict, Optional
 from playlist.song import Song
 
 
@@ -13,10 +16,10 @@ class ConstrainedShuffler:
     """
     Implements shuffle algorithms with constraints to prevent consecutive artists.
     
-    Uses array/list traversal and HashMap for efficient artist tracking.
+    Uses per-artist buckets and a max-heap to interleave artists in a single pass.
     
     Time Complexity:
-        - shuffle_with_constraints: O(n) average case, O(∞) worst case (if no valid arrangement exists)
+        - shuffle_with_constraints: O(n log k) where k is the number of unique artists
         - _has_consecutive_artists: O(n)
     
     Space Complexity:
@@ -29,56 +32,70 @@ class ConstrainedShuffler:
         Initialize the constrained shuffler.
         
         Args:
-            max_attempts (int): Maximum number of shuffle attempts before giving up (default: 1000)
+            max_attempts (int): Kept for API compatibility; the heap-based shuffle
+                needs no retries (default: 1000)
         """
         self._max_attempts = max_attempts
     
-    def shuffle_with_constraints(self, songs: List[Song]) -> List[Song]:
+    def shuffle_with_constraints(self, songs: List[Song],
+                                 artist_counts: Optional[Counter] = None) -> List[Song]:
         """
         Shuffle songs with the constraint that the same artist doesn't appear consecutively.
         
-        This implementation uses a randomized approach with reshuffling if violations occur.
-        It tries up to max_attempts times to find a valid arrangement.
+        Songs are bucketed by artist and each bucket is shuffled once. A max-heap keyed by
+        remaining bucket size then repeatedly places a song from the largest bucket whose
+        artist differs from the previously placed one (ties broken randomly). This greedy
+        construction always succeeds when an arrangement is possible, so no retries are needed.
         
-        Time Complexity: 
-            - Best/Average case: O(n) where n is the number of songs
-            - Worst case: O(max_attempts * n) if a valid arrangement is hard to find
+        Time Complexity: O(n log k) where n is the number of songs and k the number of unique artists
         Space Complexity: O(n)
         
         Args:
             songs (List[Song]): List of songs to shuffle
+            artist_counts (Counter, optional): Precomputed songs per artist key
+                (e.g. cached by the Playlist); computed from songs when omitted
             
         Returns:
-            List[Song]: Shuffled list of songs with no consecutive artists,
-                       or original list if no valid arrangement found within max_attempts
+            List[Song]: Shuffled list of songs with no consecutive artists
             
         Note:
             If it's impossible to arrange the songs without consecutive artists
-            (e.g., one artist has more than half the songs), the original list is returned.
+            (e.g., one artist has more than half the songs), a plain shuffle is returned.
         """
         if len(songs) <= 1:
             return songs.copy()
         
         # Check if it's theoretically possible to avoid consecutive artists
-        if not self._is_arrangement_possible(songs):
+        if not self._is_arrangement_possible(songs, artist_counts):
             # Return a simple shuffle if arrangement isn't possible
             result = songs.copy()
             random.shuffle(result)
             return result
         
-        # Try to find a valid arrangement
-        for _ in range(self._max_attempts):
-            # Create a shuffled copy
-            shuffled = songs.copy()
-            random.shuffle(shuffled)
-            
-            # Check if this arrangement violates the constraint
-            if not self._has_consecutive_artists(shuffled):
-                return shuffled
-        
-        # If we couldn't find a valid arrangement, return original order with warning
-        # This could happen with pathological cases
-        return songs.copy()
+        # Bucket songs by artist and shuffle each bucket once
+        buckets: Dict[str, List[Song]] = {}
+        for song in songs:
+            buckets.setdefault(song.artist_key, []).append(song)
+        
+        # Max-heap of (-remaining, random tie-breaker, bucket)
+        heap = []
+        for bucket in buckets.values():
+            random.shuffle(bucket)
+            heap.append((-len(bucket), random.random(), bucket))
+        heapq.heapify(heap)
+        
+        result = []
+        held_back = None
+        while heap:
+            remaining, _, bucket = heapq.heappop(heap)
+            result.append(bucket.pop())
+            # The previously placed artist becomes eligible again
+            if held_back is not None:
+                heapq.heappush(heap, held_back)
+            # Hold back the artist just placed so it cannot be picked next
+            held_back = (remaining + 1, random.random(), bucket) if bucket else None
+        
+        return result
     
     def _has_consecutive_artists(self, songs: List[Song]) -> bool:
         """
@@ -93,12 +110,11 @@ class ConstrainedShuffler:
         Returns:
             bool: True if there are consecutive songs by the same artist, False otherwise
         """
-        for i in range(len(songs) - 1):
-            if songs[i].artist.lower() == songs[i + 1].artist.lower():
-                return True
-        return False
+        # artist_key is interned, so an identity check suffices; islice avoids copying songs[1:]
+        return any(a.artist_key is b.artist_key for a, b in zip(songs, islice(songs, 1, None)))
     
-    def _is_arrangement_possible(self, songs: List[Song]) -> bool:
+    def _is_arrangement_possible(self, songs: List[Song],
+                                 artist_counts: Optional[Counter] = None) -> bool:
         """
         Check if it's theoretically possible to arrange songs without consecutive artists.
         
@@ -110,6 +126,7 @@ class ConstrainedShuffler:
         
         Args:
             songs (List[Song]): List of songs to check
+            artist_counts (Counter, optional): Precomputed songs per artist key
             
         Returns:
             bool: True if arrangement is possible, False otherwise
@@ -117,14 +134,12 @@ class ConstrainedShuffler:
         if len(songs) <= 1:
             return True
         
-        # Count songs per artist
-        artist_counts: Dict[str, int] = {}
-        for song in songs:
-            artist_key = song.artist.lower()
-            artist_counts[artist_key] = artist_counts.get(artist_key, 0) + 1
+        # Count songs per artist unless the caller already has the counts
+        if artist_counts is None:
+            artist_counts = Counter(song.artist_key for song in songs)
         
-        # Find the maximum count
-        max_count = max(artist_counts.values())
+        # Find the maximum count (most_common runs the selection in C)
+        max_count = artist_counts.most_common(1)[0][1]
         
         # According to the pigeonhole principle, if the most frequent artist
         # has more than ceil(n/2) songs, consecutive placement is inevitable
@@ -146,6 +161,5 @@ class ConstrainedShuffler:
         """
         distribution: Dict[str, int] = {}
         for song in songs:
-            artist_key = song.artist.lower()
-            distribution[artist_key] = distribution.get(artist_key, 0) + 1
+            distribution[song.artist_key] = distribution.get(song.artist_key, 0) + 1
         return distribution
\ No newline at end of file
@@ -1,22 +1,26 @@
-from .playlist_engine import DoublyLinkedList, Node
+from .playlist_engine import PlaylistEngine
 from .song import Song
 from song_lookup_map.lookup_map import SongLookupMap
 from .artist_blocklist import ArtistBlocklist
 from .action_logger import ActionLogger
 from .constrained_shuffle import ConstrainedShuffler
-from typing import Optional, List
+from typing import Optional, List, Tuple
+from collections import Counter
+from itertools import chain
 
 
 class Playlist:
     """
-    Wrapper around DoublyLinkedList with artist blocklist support and undo functionality.
+    Wrapper around PlaylistEngine with artist blocklist support and undo functionality.
     """
     def __init__(self, enable_dedupe: bool = True, dedupe_policy: str = 'first', max_undo_history: int = 50):
-        self.playlist = DoublyLinkedList()
+        self.playlist = PlaylistEngine()
         self.lookup_map = SongLookupMap(enable_dedupe=enable_dedupe, dedupe_policy=dedupe_policy)
         self.artist_blocklist = ArtistBlocklist()
         self.action_logger = ActionLogger(max_history=max_undo_history)
         self.constrained_shuffler = ConstrainedShuffler()
+        # Songs per normalized artist, kept in sync with playlist membership
+        self._artist_counts: Counter = Counter()
 
     def add_song(self, title: str, artist: str, duration: int, genre=None, song_id=None) -> Optional[str]:
         """
@@ -32,29 +36,12 @@ class Playlist:
         Returns:
             Optional[str]: None if song added successfully, existing song_id if duplicate and policy is 'first'
         """
-        # Check if artist is blocked
-        if self.artist_blocklist.is_blocked(artist):
-            return "BLOCKED_ARTIST"
-        
         song = Song(title, artist, duration, song_id=song_id, genre=genre)
-        # Try to add to lookup map (handles deduplication)
-        duplicate_result = self.lookup_map.add_song(song)
-        if duplicate_result is not None:
-            # Duplicate found and policy is 'first', reject the new song
-            return duplicate_result
-        
-        # Store the current size to know the index of the new song
-        index = self.playlist.size
-        
-        # Add to playlist
-        self.playlist.add_song(song)
-        
-        # Log action for undo
-        def undo_add():
-            self.delete_song(index)
-        self.action_logger.log_action("add", undo_add)
-        
-        return None
+        result, index = self._add_nolog(song)
+        if result is None:
+            # Log action for undo
+            self.action_logger.log_action("add", self._undo_add, index)
+        return result
 
     def add_existing_song(self, song: Song) -> Optional[str]:
         """
@@ -66,19 +53,36 @@ class Playlist:
         Returns:
             Optional[str]: None if song added successfully, existing song_id if duplicate and policy is 'first'
         """
-        # Check if artist is blocked
-        if self.artist_blocklist.is_blocked(song.artist):
-            return "BLOCKED_ARTIST"
+        return self._add_nolog(song)[0]
+
+    def _add_nolog(self, song: Song) -> Tuple[Optional[str], int]:
+        """
+        Shared add path: blocklist check, deduplication and append, without undo logging.
+        
+        Args:
+            song (Song): Song object to add
+            
+        Returns:
+            Tuple[Optional[str], int]: (None, index of the new song) on success,
+                otherwise ("BLOCKED_ARTIST" or the existing song_id, -1)
+        """
+        # Check if artist is blocked, reusing the key normalized by Song
+        if self.artist_blocklist.is_blocked_normalized(song.artist_key):
+            return "BLOCKED_ARTIST", -1
         
         # Try to add to lookup map (handles deduplication)
         duplicate_result = self.lookup_map.add_song(song)
         if duplicate_result is not None:
             # Duplicate found and policy is 'first', reject the new song
-            return duplicate_result
+            return duplicate_result, -1
+        
+        # Store the current size to know the index of the new song
+        index = self.playlist.size
         
         # Add to playlist
         self.playlist.add_song(song)
-        return None
+        self._artist_counts[song.artist_key] += 1
+        return None, index
 
     def delete_song(self, index: int) -> bool:
         """
@@ -93,69 +97,46 @@ class Playlist:
         Raises:
             IndexError: If index is out of bounds (for backward compatibility with tests)
         """
-        # First get the song to get its ID for lookup map removal
-        if index < 0 or index >= self.playlist.size:
-            raise IndexError("Index out of bounds")
-            
-        # Navigate to the node
-        current = self.playlist.head
-        for _ in range(index):
-            current = current.next
-            
-        # Store song info for undo
-        song = current.song
+        # Remove from playlist in a single step; the removed song is kept for undo
+        # (raises IndexError if index is out of bounds)
+        song = self.playlist.delete_song(index)
+        self._uncount_artist(song)
         song_id = song.song_id
             
         # Remove from lookup map
         if song_id is not None:
             self.lookup_map.remove_song(song_id)
-            
-        # Remove from playlist
-        self.playlist.delete_song(index)
         
         # Log action for undo
-        def undo_delete():
-            # Recreate the song object
-            restored_song = Song(song.title, song.artist, song.duration, song_id=song_id, genre=getattr(song, 'genre', None))
-            # Add it back at the same index
-            self._insert_song_at_index(restored_song, index)
-        self.action_logger.log_action("delete", undo_delete)
+        self.action_logger.log_action("delete", self._undo_delete, song, index)
         
         return True
 
     def move_song(self, from_index: int, to_index: int):
         self.playlist.move_song(from_index, to_index)
         # Log action for undo
-        def undo_move():
-            self.playlist.move_song(to_index, from_index)
-        self.action_logger.log_action("move", undo_move)
+        self.action_logger.log_action("move", self.playlist.move_song, to_index, from_index)
 
     def reverse_playlist(self):
         self.playlist.reverse_playlist()
         # Log action for undo
-        def undo_reverse():
-            self.playlist.reverse_playlist()
-        self.action_logger.log_action("reverse", undo_reverse)
+        self.action_logger.log_action("reverse", self.playlist.reverse_playlist)
 
     def get_all_songs(self):
-        songs = []
-        node = self.playlist.head
-        while node:
-            songs.append(node.song)
-            node = node.next
-        return songs
+        return self.playlist.get_all_songs()
 
     def is_empty(self):
-        return self.playlist.head is None
+        return self.playlist.size == 0
 
     def pop_next(self):
-        if self.playlist.head is None:
+        if self.playlist.size == 0:
             return None
-        s = self.playlist.head.song
+        # Detach the head in one step (playback consumption, not logged for undo)
+        s = self.playlist.popleft()
         # Remove from lookup map
         if s.song_id is not None:
             self.lookup_map.remove_song(s.song_id)
-        self.playlist.delete_song(0)
+        self._uncount_artist(s)
         return s
     
     def _insert_song_at_index(self, song: Song, index: int):
@@ -169,35 +150,46 @@ class Playlist:
         # Add to lookup map
         self.lookup_map.add_song(song)
         
-        # Handle special cases
-        if index == 0:
-            # Insert at head
-            new_node = Node(song)
-            new_node.next = self.playlist.head
-            if self.playlist.head:
-                self.playlist.head.prev = new_node
-            self.playlist.head = new_node
-            if self.playlist.tail is None:
-                self.playlist.tail = new_node
-        elif index >= self.playlist.size:
-            # Append to tail
-            self.playlist.add_song(song)
-            return
+        # Indices past the tail append, matching list.insert semantics
+        self.playlist.insert_song(index, song)
+        self._artist_counts[song.artist_key] += 1
+    
+    def _uncount_artist(self, song: Song) -> None:
+        """Decrement the cached artist count for a removed song."""
+        key = song.artist_key
+        remaining = self._artist_counts[key] - 1
+        if remaining:
+            self._artist_counts[key] = remaining
         else:
-            # Insert in middle
-            current = self.playlist.head
-            for _ in range(index):
-                current = current.next
-            new_node = Node(song)
-            new_node.prev = current.prev
-            new_node.next = current
-            if current.prev:
-                current.prev.next = new_node
-            else:
-                self.playlist.head = new_node
-            current.prev = new_node
+            del self._artist_counts[key]
+    
+    def _undo_add(self, index: int) -> None:
+        """Undo an add by deleting the song at its recorded index."""
+        self.delete_song(index)
+    
+    def _undo_delete(self, song: Song, index: int) -> None:
+        """Undo a delete by restoring a copy of the song at its original index."""
+        restored_song = Song(song.title, song.artist, song.duration, song_id=song.song_id, genre=song.genre)
+        self._insert_song_at_index(restored_song, index)
+    
+    def _undo_shuffle(self, original_order: List[Song]) -> None:
+        """
+        Undo a shuffle by restoring the recorded pre-shuffle order.
         
-        self.playlist.size += 1
+        Songs are matched by identity, so unlogged changes since the shuffle
+        (pop_next, add_existing_song) are kept: songs no longer in the playlist
+        are skipped and songs added since follow in their current order.
+        """
+        current = self.playlist.get_all_songs()
+        remaining = Counter(map(id, current))
+        restored = []
+        # Recorded songs still present first, then anything added since
+        for song in chain(original_order, current):
+            key = id(song)
+            if remaining[key]:
+                remaining[key] -= 1
+                restored.append(song)
+        self.playlist.reorder_songs(restored)
     
     def undo_last_n_actions(self, n: int) -> List[str]:
         """
@@ -212,29 +204,31 @@ class Playlist:
         Returns:
             List[str]: List of action types that were undone
         """
-        return self.action_logger.undo_last_n_actions(n)
+        # Undo functions reuse the public edit methods; keep them from logging new actions
+        with self.action_logger.suppressed():
+            return self.action_logger.undo_last_n_actions(n)
     
     def shuffle_with_artist_constraints(self) -> List[Song]:
         """
         Shuffle the playlist with constraints to prevent consecutive artists.
         
-        Time Complexity: O(n) average case
+        Time Complexity: O(n log k) where k is the number of unique artists
         Space Complexity: O(n)
         
         Returns:
             List[Song]: Shuffled list of songs with no consecutive artists
         """
         songs = self.get_all_songs()
-        shuffled_songs = self.constrained_shuffler.shuffle_with_constraints(songs)
+        shuffled_songs = self.constrained_shuffler.shuffle_with_constraints(
+            songs, artist_counts=self._artist_counts)
         
-        # Update the playlist with the shuffled order
-        # First clear the playlist
-        while not self.is_empty():
-            self.delete_song(0)
+        # Reorder the existing songs in place; membership is unchanged,
+        # so the lookup map needs no updates
+        self.playlist.reorder_songs(shuffled_songs)
         
-        # Then add the shuffled songs
-        for song in shuffled_songs:
-            self.add_existing_song(song)
+        # Log a single action for undo, storing the pre-shuffle order
+        # (songs is already a private copy from get_all_songs)
+        self.action_logger.log_action("shuffle", self._undo_shuffle, songs)
         
         return shuffled_songs
     
@@ -262,20 +256,17 @@ class Playlist:
         songs1 = self.get_all_songs()
         songs2 = other_playlist.get_all_songs()
         
-        i, j = 0, 0
-        while i < len(songs1) and j < len(songs2):
-            merged_playlist.add_existing_song(songs1[i])
-            i += 1
-            
-            merged_playlist.add_existing_song(songs2[j])
-            j += 1
-        
-        while i < len(songs1):
-            merged_playlist.add_existing_song(songs1[i])
-            i += 1
+        # Interleave the common prefix with slice assignment, then append the tail
+        k = min(len(songs1), len(songs2))
+        merged = [None] * (2 * k)
+        merged[0::2] = songs1[:k]
+        merged[1::2] = songs2[:k]
+        merged.extend(songs1[k:])
+        merged.extend(songs2[k:])
         
-        while j < len(songs2):
-            merged_playlist.add_existing_song(songs2[j])
-            j += 1
+        # The new playlist has an empty blocklist, so only deduplication applies
+        kept = merged_playlist.lookup_map.add_songs(merged)
+        merged_playlist.playlist.add_songs(kept)
+        merged_playlist._artist_counts.update(song.artist_key for song in kept)
         
         return merged_playlist
\ No newline at end of file
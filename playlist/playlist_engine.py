@@ -1,100 +1,93 @@
-from .linked_list import Node
+from typing import Deque, List
+from collections import deque
 from .song import Song
 
-class DoublyLinkedList:
+class PlaylistEngine:
     """
-    Doubly linked list implementation to represent the playlist.
-    Supports insertion, deletion, moving nodes, and reversing the list.
+    Double-ended queue (collections.deque) implementation to represent the playlist.
+    Supports insertion, deletion, moving songs, and reversing the list.
+
+    The deque is a linked list of fixed-size blocks: removing the head song
+    (playback order) is O(1), and index-based operations skip whole blocks
+    instead of walking node by node.
 
     Time Complexity (operations):
     - add_song: O(1) (at tail)
+    - popleft: O(1) (at head)
+    - get_song: O(N) worst case, O(1) near either end
+    - insert_song: O(N)
     - delete_song: O(N)
     - move_song: O(N)
     - reverse_playlist: O(N)
     Space Complexity: O(N) for N songs in playlist
     """
     def __init__(self):
-        self.head = None
-        self.tail = None
-        self.size = 0
+        self._songs: Deque[Song] = deque()
+
+    @property
+    def size(self) -> int:
+        return len(self._songs)
 
     def add_song(self, song: Song):
-        new_node = Node(song)
-        if not self.head:
-            self.head = self.tail = new_node
-        else:
-            self.tail.next = new_node
-            new_node.prev = self.tail
-            self.tail = new_node
-        self.size += 1
+        self._songs.append(song)
+
+    def add_songs(self, songs: List[Song]):
+        self._songs.extend(songs)
 
-    def delete_song(self, index: int):
-        if index < 0 or index >= self.size:
+    def insert_song(self, index: int, song: Song):
+        self._songs.insert(index, song)
+
+    def get_song(self, index: int) -> Song:
+        if index < 0 or index >= len(self._songs):
             raise IndexError("Index out of bounds")
-        current = self.head
-        for _ in range(index):
-            current = current.next
-        if current.prev:
-            current.prev.next = current.next
-        else:
-            self.head = current.next
-        if current.next:
-            current.next.prev = current.prev
-        else:
-            self.tail = current.prev
-        self.size -= 1
+        return self._songs[index]
+
+    def delete_song(self, index: int) -> Song:
+        """
+        Remove the song at index and return it, so callers need no separate lookup.
+        """
+        if index < 0 or index >= len(self._songs):
+            raise IndexError("Index out of bounds")
+        song = self._songs[index]
+        del self._songs[index]
+        return song
+
+    def popleft(self) -> Song:
+        """
+        Remove and return the first song in O(1).
+        Raises IndexError if the playlist is empty.
+        """
+        return self._songs.popleft()
 
     def move_song(self, from_index: int, to_index: int):
-        if (from_index < 0 or from_index >= self.size or
-            to_index < 0 or to_index >= self.size):
+        size = len(self._songs)
+        if (from_index < 0 or from_index >= size or
+            to_index < 0 or to_index >= size):
             raise IndexError("Index out of bounds")
         if from_index == to_index:
             return
-        # Remove node at from_index
-        current = self.head
-        for _ in range(from_index):
-            current = current.next
-        # Disconnect node
-        if current.prev:
-            current.prev.next = current.next
-        else:
-            self.head = current.next
-        if current.next:
-            current.next.prev = current.prev
-        else:
-            self.tail = current.prev
+        song = self._songs[from_index]
+        del self._songs[from_index]
+        self._songs.insert(to_index, song)
 
-        # Insert node at to_index
-        if to_index == 0:
-            current.next = self.head
-            if self.head:
-                self.head.prev = current
-            current.prev = None
-            self.head = current
-            if self.tail is None:
-                self.tail = current
-        else:
-            target = self.head
-            for _ in range(to_index - 1):
-                target = target.next
-            current.next = target.next
-            if target.next:
-                target.next.prev = current
-            current.prev = target
-            target.next = current
+    def reorder_songs(self, songs: List[Song]):
+        """
+        Replace the playlist order in place with a permutation of its songs.
+        Time Complexity: O(N)
+        """
+        self._songs.clear()
+        self._songs.extend(songs)
 
     def reverse_playlist(self):
         """
         Reverses the playlist in-place.
         Time Complexity: O(N)
         """
-        current = self.head
-        self.tail = self.head
-        prev_node = None
-        while current:
-            next_node = current.next
-            current.next = prev_node
-            current.prev = next_node
-            prev_node = current
-            current = next_node
-        self.head = prev_node
+        self._songs.reverse()
+
+    def get_all_songs(self) -> List[Song]:
+        """
+        Return a list copy of the songs in playlist order.
+        Time Complexity: O(N)
+        """
+        return list(self._songs)
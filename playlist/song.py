@@ -1,7 +1,25 @@
+import sys
+
+
+def normalize_artist(artist) -> str:
+    """
+    Normalize an artist name for case/whitespace-insensitive matching.
+    The result is interned so equal keys can be compared by identity.
+    """
+    if not artist:
+        return ""
+    return sys.intern(artist.strip().lower())
+
+
 class Song:
     """
     Represents a Song entity in the playlist.
     """
+    # Fixed attribute layout: no per-instance __dict__. added_time is optional
+    # and only set by callers that track recency (see SortEngine).
+    __slots__ = ('song_id', 'title', 'artist', 'duration', 'genre', 'play_count',
+                 'artist_key', 'added_time', 'dedupe_key')
+
     def __init__(self, title, artist, duration, song_id=None, genre=None):
         self.song_id = song_id
         self.title = title
@@ -12,5 +30,11 @@ class Song:
         self.genre = genre
         self.play_count = 0
 
+        # Normalized artist, computed once for blocklist/shuffle comparisons
+        self.artist_key = normalize_artist(artist)
+
+        # Normalized (title, artist) duplicate key, filled in lazily by DuplicateCleaner
+        self.dedupe_key = None
+
     def increment_play_count(self):
         self.play_count += 1
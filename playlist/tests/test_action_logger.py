@@ -69,6 +69,20 @@ def test_undo_last_n_actions():
     assert undo_calls[1] == "undo_delete_2"
 
 
+def test_undo_with_positional_args():
+    """Test that positional undo arguments are stored and passed back in order."""
+    logger = ActionLogger()
+    undo_calls = []
+
+    def undo_move(from_idx, to_idx):
+        undo_calls.append((from_idx, to_idx))
+
+    logger.log_action("move", undo_move, 3, 0)
+
+    assert logger.undo_last_n_actions(1) == ["move"]
+    assert undo_calls == [(3, 0)]
+
+
 def test_undo_more_than_available():
     """Test undoing more actions than available."""
     logger = ActionLogger()
@@ -87,6 +101,57 @@ def test_undo_more_than_available():
     assert logger.get_history_size() == 0
 
 
+def test_undo_does_not_consume_actions_logged_during_undo():
+    """Test that actions logged by an undo function are not undone in the same call."""
+    logger = ActionLogger()
+
+    def undo_and_log():
+        logger.log_action("logged_during_undo", lambda: None)
+
+    logger.log_action("add1", lambda: None)
+    logger.log_action("add2", undo_and_log)
+
+    undone = logger.undo_last_n_actions(2)
+    assert undone == ["add2", "add1"]
+    assert logger.get_action_history() == ["logged_during_undo"]
+
+
+def test_failed_undo_keeps_remaining_actions():
+    """Test that actions not yet undone stay in history when an undo function raises."""
+    logger = ActionLogger()
+    undo_calls = []
+
+    def failing_undo():
+        raise IndexError("Index out of bounds")
+
+    logger.log_action("add1", lambda: undo_calls.append("add1"))
+    logger.log_action("add2", lambda: undo_calls.append("add2"))
+    logger.log_action("add3", failing_undo)
+    logger.log_action("add4", lambda: undo_calls.append("add4"))
+
+    with pytest.raises(IndexError):
+        logger.undo_last_n_actions(4)
+    assert undo_calls == ["add4"]
+    assert logger.get_action_history() == ["add1", "add2"]
+
+    assert logger.undo_last_n_actions(2) == ["add2", "add1"]
+    assert undo_calls == ["add4", "add2", "add1"]
+
+
+def test_suppressed_skips_logging_and_restores_state():
+    """Test that actions are not logged inside suppressed(), even when nested."""
+    logger = ActionLogger()
+
+    with logger.suppressed():
+        logger.log_action("hidden", lambda: None)
+        with logger.suppressed():
+            logger.log_action("hidden_nested", lambda: None)
+        logger.log_action("hidden_after_nested", lambda: None)
+
+    logger.log_action("visible", lambda: None)
+    assert logger.get_action_history() == ["visible"]
+
+
 def test_clear_history():
     """Test clearing all actions from history."""
     logger = ActionLogger()
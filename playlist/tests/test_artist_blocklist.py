@@ -8,6 +8,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 
 import pytest
 from playlist.artist_blocklist import ArtistBlocklist
+from playlist.song import Song
 
 
 def test_initialize_blocklist():
@@ -132,5 +133,14 @@ def test_get_blocked_artists_returns_copy():
     assert "queen" not in original_blocked
 
 
+def test_is_blocked_normalized():
+    """Test checking a Song's precomputed artist key against the blocklist."""
+    blocklist = ArtistBlocklist()
+    blocklist.add_artist("  The Beatles ")
+
+    assert blocklist.is_blocked_normalized(Song("Hey Jude", "THE BEATLES", 431).artist_key) is True
+    assert blocklist.is_blocked_normalized(Song("Bohemian Rhapsody", "Queen", 354).artist_key) is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
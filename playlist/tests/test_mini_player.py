@@ -11,6 +11,18 @@ from playlist.mini_player import MiniPlayer
 from playlist.song import Song
 
 
+@pytest.fixture(scope="module")
+def sample_songs():
+    """Songs shared by the tests; MiniPlayer never mutates them."""
+    return [
+        Song("Song 1", "Artist A", 180),
+        Song("Song 2", "Artist B", 200),
+        Song("Song 3", "Artist C", 190),
+        Song("Song 4", "Artist D", 210),
+        Song("Song 5", "Artist E", 195)
+    ]
+
+
 def test_initialize_mini_player():
     """Test initializing a mini player."""
     player = MiniPlayer()
@@ -21,19 +33,11 @@ def test_initialize_mini_player():
     assert player.get_played_songs() == []
 
 
-def test_preload_songs():
+def test_preload_songs(sample_songs):
     """Test preloading songs into the player."""
     player = MiniPlayer(window_size=3)
     
-    songs = [
-        Song("Song 1", "Artist A", 180),
-        Song("Song 2", "Artist B", 200),
-        Song("Song 3", "Artist C", 190),
-        Song("Song 4", "Artist D", 210),
-        Song("Song 5", "Artist E", 195)
-    ]
-    
-    player.preload_songs(songs)
+    player.preload_songs(sample_songs)
     
     # Only first 3 songs should be in upcoming (due to window size)
     upcoming = player.get_upcoming_songs()
@@ -47,17 +51,11 @@ def test_preload_songs():
     assert player.get_current_song() is None
 
 
-def test_play_next():
+def test_play_next(sample_songs):
     """Test playing songs sequentially."""
     player = MiniPlayer(window_size=3)
     
-    songs = [
-        Song("Song 1", "Artist A", 180),
-        Song("Song 2", "Artist B", 200),
-        Song("Song 3", "Artist C", 190)
-    ]
-    
-    player.preload_songs(songs)
+    player.preload_songs(sample_songs[:3])
     
     # Play first song
     song1 = player.play_next()
@@ -89,17 +87,11 @@ def test_play_next():
     assert player.is_finished() is True
 
 
-def test_set_window_size():
+def test_set_window_size(sample_songs):
     """Test changing the window size."""
     player = MiniPlayer(window_size=2)
     
-    songs = [
-        Song("Song 1", "Artist A", 180),
-        Song("Song 2", "Artist B", 200),
-        Song("Song 3", "Artist C", 190),
-        Song("Song 4", "Artist D", 210)
-    ]
-    
+    songs = sample_songs[:4]
     player.preload_songs(songs)
     
     # Initially only 2 songs should be in upcoming
@@ -87,5 +87,86 @@ class TestPlaylistEngine(unittest.TestCase):
         except Exception as e:
             self.fail(f"reverse_playlist() raised Exception unexpectedly: {e}")
 
+    def test_shuffle_reorders_in_place_and_undo_restores_order(self):
+        """
+        Constrained shuffle keeps the same songs and lookup entries,
+        logs a single action, and undo restores the original order.
+        """
+        self.playlist.add_song("Song A", "Artist A", 200, song_id="a")
+        self.playlist.add_song("Song B", "Artist A", 180, song_id="b")
+        self.playlist.add_song("Song C", "Artist C", 220, song_id="c")
+        self.playlist.clear_action_history()
+        original = self.playlist.get_all_songs()
+
+        shuffled = self.playlist.shuffle_with_artist_constraints()
+
+        self.assertEqual(self.playlist.get_all_songs(), shuffled)
+        self.assertEqual(sorted(s.title for s in shuffled), ["Song A", "Song B", "Song C"])
+        self.assertIs(self.playlist.lookup_map.lookup_song_by_id("b"), original[1])
+        self.assertEqual(self.playlist.get_action_history(), ["shuffle"])
+
+        self.playlist.undo_last_n_actions(1)
+        self.assertEqual(self.playlist.get_all_songs(), original)
+
+    def test_shuffle_undo_after_pop_next(self):
+        """
+        Undoing a shuffle after an unlogged pop_next restores the remaining songs.
+        """
+        for title, artist in [("Song A", "Artist A"), ("Song B", "Artist B"),
+                              ("Song C", "Artist C"), ("Song D", "Artist A")]:
+            self.playlist.add_song(title, artist, 200)
+        original = self.playlist.get_all_songs()
+        self.playlist.shuffle_with_artist_constraints()
+
+        popped = self.playlist.pop_next()
+        self.assertEqual(self.playlist.undo_last_n_actions(1), ["shuffle"])
+
+        self.assertEqual(self.playlist.get_all_songs(), [s for s in original if s is not popped])
+
+    def test_shuffle_undo_keeps_songs_added_since(self):
+        """
+        Undoing a shuffle keeps songs added without logging after it, at the end.
+        """
+        for title, artist in [("Song A", "Artist A"), ("Song B", "Artist B"),
+                              ("Song C", "Artist C")]:
+            self.playlist.add_song(title, artist, 200)
+        original = self.playlist.get_all_songs()
+        self.playlist.shuffle_with_artist_constraints()
+
+        extra = Song("Song E", "Artist E", 150)
+        self.playlist.add_existing_song(extra)
+        self.assertEqual(self.playlist.undo_last_n_actions(1), ["shuffle"])
+
+        self.assertEqual(self.playlist.get_all_songs(), original + [extra])
+
+    def test_undo_add_should_not_log_new_actions(self):
+        """
+        Undoing edits must not push the compensating edits onto the history.
+        """
+        self.playlist.add_song("Song A", "Artist A", 200)
+        self.playlist.add_song("Song B", "Artist B", 180)
+
+        undone = self.playlist.undo_last_n_actions(1)
+
+        self.assertEqual(undone, ["add"])
+        self.assertEqual([s.title for s in self.playlist.get_all_songs()], ["Song A"])
+        self.assertEqual(self.playlist.get_action_history(), ["add"])
+
+    def test_artist_counts_track_membership(self):
+        """
+        The cached per-artist counts follow adds, deletes, pops and undo.
+        """
+        self.playlist.add_song("Song A", "Artist A", 200)
+        self.playlist.add_song("Song B", " artist a ", 180)
+        self.playlist.add_song("Song C", "Artist C", 220)
+        self.assertEqual(dict(self.playlist._artist_counts), {"artist a": 2, "artist c": 1})
+
+        self.playlist.delete_song(2)
+        self.playlist.pop_next()
+        self.assertEqual(dict(self.playlist._artist_counts), {"artist a": 1})
+
+        self.playlist.undo_last_n_actions(1)
+        self.assertEqual(dict(self.playlist._artist_counts), {"artist a": 1, "artist c": 1})
+
 if __name__ == '__main__':
     unittest.main()
@@ -9,67 +9,51 @@ class TestSortEngine(unittest.TestCase):
     by multiple criteria using the custom merge sort implementation.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
-        Setup called before each test, initializes SortEngine and sample songs.
+        Setup called once for the class, initializes SortEngine and sample songs.
+        Sorting returns new lists and never mutates the songs, so tests can share them.
         """
-        self.sort_engine = SortEngine()
+        cls.sort_engine = SortEngine()
 
         # Current timestamp for added_time (simulate recentness)
         now = int(time.time())
 
         # Create sample Song objects with varying attributes:
-        self.song1 = Song("Imagine", "John Lennon", 183, song_id=1)
-        self.song1.added_time = now - 100  # Added 100 seconds ago
+        cls.song1 = Song("Imagine", "John Lennon", 183, song_id=1)
+        cls.song1.added_time = now - 100  # Added 100 seconds ago
 
-        self.song2 = Song("Bohemian Rhapsody", "Queen", 354, song_id=2)
-        self.song2.added_time = now - 200  # Added 200 seconds ago
+        cls.song2 = Song("Bohemian Rhapsody", "Queen", 354, song_id=2)
+        cls.song2.added_time = now - 200  # Added 200 seconds ago
 
-        self.song3 = Song("Hey Jude", "The Beatles", 431, song_id=3)
-        self.song3.added_time = now - 50   # Added 50 seconds ago (most recent)
+        cls.song3 = Song("Hey Jude", "The Beatles", 431, song_id=3)
+        cls.song3.added_time = now - 50   # Added 50 seconds ago (most recent)
 
-        self.song4 = Song("All You Need Is Love", "The Beatles", 180, song_id=4)
-        self.song4.added_time = now - 150  # Added 150 seconds ago
+        cls.song4 = Song("All You Need Is Love", "The Beatles", 180, song_id=4)
+        cls.song4.added_time = now - 150  # Added 150 seconds ago
 
-    def test_merge_sort_alpha_title(self):
+    def test_merge_sort_by_criteria(self):
         """
-        Test merge sort sorts songs alphabetically by title (case insensitive).
+        Test merge sort orders songs by each criteria: title (case insensitive),
+        ascending/descending duration, and recent addition (most recent first).
+        Each criteria runs as a subtest sharing the same sample songs.
         """
         songs = [self.song1, self.song2, self.song3, self.song4]
-        sorted_songs = self.sort_engine.merge_sort(songs, SortCriteria.ALPHA_TITLE)
-        titles = [s.title for s in sorted_songs]
-        expected = ["All You Need Is Love", "Bohemian Rhapsody", "Hey Jude", "Imagine"]
-        self.assertEqual(titles, expected)
+        cases = [
+            (SortCriteria.ALPHA_TITLE, lambda s: s.title.lower(), False),
+            (SortCriteria.DURATION_ASC, lambda s: s.duration, False),
+            (SortCriteria.DURATION_DESC, lambda s: s.duration, True),
+            (SortCriteria.RECENT, lambda s: s.added_time, True),
+        ]
+        for criteria, key, reverse in cases:
+            with self.subTest(criteria=criteria):
+                sorted_songs = self.sort_engine.merge_sort(songs, criteria)
+                self.assertEqual([key(s) for s in sorted_songs], sorted(map(key, songs), reverse=reverse))
 
-    def test_merge_sort_duration_asc(self):
-        """
-        Test merge sort sorts songs by ascending duration (shortest first).
-        """
-        songs = [self.song1, self.song2, self.song3, self.song4]
-        sorted_songs = self.sort_engine.merge_sort(songs, SortCriteria.DURATION_ASC)
-        durations = [s.duration for s in sorted_songs]
-        expected = sorted([s.duration for s in songs])
-        self.assertEqual(durations, expected)
-
-    def test_merge_sort_duration_desc(self):
-        """
-        Test merge sort sorts songs by descending duration (longest first).
-        """
-        songs = [self.song1, self.song2, self.song3, self.song4]
-        sorted_songs = self.sort_engine.merge_sort(songs, SortCriteria.DURATION_DESC)
-        durations = [s.duration for s in sorted_songs]
-        expected = sorted([s.duration for s in songs], reverse=True)
-        self.assertEqual(durations, expected)
-
-    def test_merge_sort_recent(self):
-        """
-        Test merge sort sorts songs by recent addition (most recent first).
-        """
-        songs = [self.song1, self.song2, self.song3, self.song4]
-        sorted_songs = self.sort_engine.merge_sort(songs, SortCriteria.RECENT)
-        added_times = [s.added_time for s in sorted_songs]
-        # Times should be sorted descending (most recent = highest timestamp first)
-        self.assertEqual(added_times, sorted(added_times, reverse=True))
+        # Spell out the alphabetical order once as a sanity check
+        titles = [s.title for s in self.sort_engine.merge_sort(songs, SortCriteria.ALPHA_TITLE)]
+        self.assertEqual(titles, ["All You Need Is Love", "Bohemian Rhapsody", "Hey Jude", "Imagine"])
 
     def test_stability(self):
         """
@@ -5,9 +5,15 @@ Returns candidate songs that were NOT played recently but are similar to user's
 using simple, fast similarity checks (genre + numeric thresholds for duration/BPM).
 """
 
-from typing import Dict, List, Set, Optional, Tuple, Any
+import heapq
+import math
+import sys
+from typing import Dict, List, Set, Optional, Tuple, Any, Iterable, Iterator, Mapping
 from collections import deque, defaultdict
+from itertools import islice
 from dataclasses import dataclass
+from operator import itemgetter
+from types import MappingProxyType
 from playlist.song import Song
 
 
@@ -30,12 +36,13 @@ class SmartRecommender:
        b. For each seed song, compute candidate pool via PlaylistExplorer
        c. Filter out recently played, skipped, and active playlist songs
        d. Apply similarity scoring (genre, subgenre, mood, duration, BPM)
-       e. Aggregate scores across seeds
+       e. Aggregate scores across seeds (optionally decayed by seed recency)
        f. Return top N candidates sorted by score
     
     Time Complexity:
-        - record_play: O(1)
+        - record_play: O(log S) amortized
         - recommend: O(k * M log N) where k=seed_count, M=candidates per seed, N=top_n
+        - get_popular_songs: O((N + F) log S) amortized, F=filtered-out songs
     
     Space Complexity:
         - O(W + S) where W=window size, S=total songs
@@ -44,7 +51,7 @@ class SmartRecommender:
     def __init__(self, playlist_explorer, skipped_tracker, playlist_songs_getter, 
                  window_size: int = 50, seed_count: int = 5, top_n: int = 10,
                  duration_threshold: int = 120, bpm_threshold: int = 10,
-                 max_candidates_per_seed: int = 200):
+                 max_candidates_per_seed: int = 200, seed_decay_tau: Optional[float] = None):
         """
         Initialize the Smart Recommender.
         
@@ -58,6 +65,11 @@ class SmartRecommender:
             duration_threshold (int): Threshold for duration similarity in seconds (default: 120)
             bpm_threshold (int): Threshold for BPM similarity (default: 10)
             max_candidates_per_seed (int): Max candidates to consider per seed (default: 200)
+            seed_decay_tau (Optional[float]): If set, weight the i-th most recent seed's
+                scores by exp(-i / seed_decay_tau); None weights all seeds equally (default: None)
+            
+        Raises:
+            ValueError: If seed_decay_tau is not positive
         """
         # Dependencies
         self.playlist_explorer = playlist_explorer
@@ -71,19 +83,37 @@ class SmartRecommender:
         self.duration_threshold = duration_threshold
         self.bpm_threshold = bpm_threshold
         self.max_candidates_per_seed = max_candidates_per_seed
+        if seed_decay_tau is not None and seed_decay_tau <= 0:
+            raise ValueError("seed_decay_tau must be positive")
+        self.seed_decay_tau = seed_decay_tau
         
         # State
         self.play_window = deque(maxlen=window_size)  # Sliding window of (song_id, timestamp)
         self.played_set: Set[str] = set()  # For O(1) lookup of recently played songs
         self.song_metadata: Dict[str, Dict[str, Any]] = {}  # song_id -> metadata
-        self.total_listen_time: Dict[str, int] = defaultdict(int)  # song_id -> total seconds
+        # song_id -> total seconds; private so every update also reaches the heap
+        self._total_listen_time: Dict[str, int] = defaultdict(int)
+        # Max-heap of (-total_listen_time, first_seen, song_id) with lazy updates;
+        # entries whose total no longer matches _total_listen_time are stale
+        self._popularity_heap: List[Tuple[int, int, str]] = []
+        self._first_seen: Dict[str, int] = {}  # song_id -> order of first play (tie-breaker)
+        # song_id -> (metadata dict, normalized similarity profile); the dict is kept
+        # so entries assigned directly to song_metadata are re-normalized
+        self._profiles: Dict[str, Tuple[Dict[str, Any], Tuple[str, str, str, int, int]]] = {}
+    
+    @property
+    def total_listen_time(self) -> Mapping[str, int]:
+        """
+        Read-only view of total listen time per song_id; use record_play to update it.
+        """
+        return MappingProxyType(self._total_listen_time)
     
     def record_play(self, song_id: str, played_at: float, play_duration: int, 
                     metadata: Optional[Dict[str, Any]] = None) -> None:
         """
         Record a play event to update sliding window and play stats.
         
-        Time Complexity: O(1)
+        Time Complexity: O(log S) amortized where S is number of songs with play data
         Space Complexity: O(1) amortized
         
         Args:
@@ -99,13 +129,40 @@ class SmartRecommender:
         self.played_set.add(song_id)
         
         # Update total listen time
-        self.total_listen_time[song_id] += play_duration
-        
-        # Store metadata if provided
+        first_seen = self._first_seen.get(song_id)
+        is_new = first_seen is None
+        if is_new:
+            first_seen = self._first_seen[song_id] = len(self._first_seen)
+        self._total_listen_time[song_id] += play_duration
+        
+        # Push the new total; the previous entry for this song becomes stale
+        if is_new or play_duration:
+            heap = self._popularity_heap
+            heapq.heappush(heap, (-self._total_listen_time[song_id], first_seen, song_id))
+            # Drop stale entries once they outnumber the live ones
+            if len(heap) > 2 * len(self._first_seen):
+                self._rebuild_popularity_heap()
+        
+        # Store metadata if provided, normalizing it for scoring once up front
         if metadata:
             self.song_metadata[song_id] = metadata
+            self._profiles[song_id] = (metadata, self._similarity_profile(metadata))
+    
+    def _rebuild_popularity_heap(self) -> None:
+        """
+        Rebuild the popularity heap from total_listen_time, discarding stale entries.
+        
+        Time Complexity: O(S) where S is number of songs with play data
+        Space Complexity: O(S)
+        """
+        first_seen = self._first_seen
+        heap = [(-total, first_seen[song_id], song_id)
+                for song_id, total in self._total_listen_time.items()]
+        heapq.heapify(heap)
+        self._popularity_heap = heap
     
-    def _get_similar_songs(self, seed_song_id: str) -> Set[str]:
+    def _get_similar_songs(self, seed_song_id: str,
+                           search_cache: Optional[Dict[Tuple[Optional[str], ...], Set[str]]] = None) -> Set[str]:
         """
         Get similar songs to a seed song using PlaylistExplorer.
         
@@ -114,6 +171,9 @@ class SmartRecommender:
         
         Args:
             seed_song_id (str): ID of the seed song
+            search_cache (Optional[Dict]): Search results by (genre, subgenre, mood),
+                shared by seeds within one recommend() call so seeds with the same
+                criteria search the explorer only once
             
         Returns:
             Set[str]: Set of similar song IDs
@@ -139,10 +199,18 @@ class SmartRecommender:
             # Note: We intentionally exclude artist to find similar songs by different artists
                 
             # Use PlaylistExplorer to find similar songs
-            similar_songs = self.playlist_explorer.search(criteria)
-            # Exclude the seed song itself from recommendations
-            similar_songs.discard(seed_song_id)
-            return similar_songs
+            if search_cache is None:
+                similar_songs = self.playlist_explorer.search(criteria)
+                # Exclude the seed song itself from recommendations
+                similar_songs.discard(seed_song_id)
+                return similar_songs
+            
+            key = (genre, criteria.get('subgenre'), criteria.get('mood'))
+            matches = search_cache.get(key)
+            if matches is None:
+                matches = search_cache[key] = self.playlist_explorer.search(criteria)
+            # Exclude the seed song itself, leaving the cached set untouched
+            return matches.difference((seed_song_id,))
         
         return set()
     
@@ -165,12 +233,73 @@ class SmartRecommender:
             Tuple[float, str]: (score, reason)
         """
         if seed_id not in self.song_metadata or candidate_id not in self.song_metadata:
-            # print(f"DEBUG: Missing metadata for seed={seed_id} or candidate={candidate_id}")
-            # print(f"DEBUG: seed_metadata={seed_id in self.song_metadata}, candidate_metadata={candidate_id in self.song_metadata}")
             return 0.0, "Missing metadata"
         
-        seed_meta = self.song_metadata[seed_id]
-        candidate_meta = self.song_metadata[candidate_id]
+        return self._score_profiles(self._get_profile(seed_id), self._get_profile(candidate_id))
+    
+    def _get_profile(self, song_id: str) -> Optional[Tuple[str, str, str, int, int]]:
+        """
+        Get the normalized similarity profile of a song, computing it at most
+        once per metadata dict. Metadata dicts are treated as read-only once stored.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        
+        Args:
+            song_id (str): ID of the song
+            
+        Returns:
+            Optional[Tuple[str, str, str, int, int]]: The profile, or None if the
+                song has no metadata
+        """
+        meta = self.song_metadata.get(song_id)
+        if meta is None:
+            return None
+        cached = self._profiles.get(song_id)
+        if cached is None or cached[0] is not meta:
+            cached = (meta, self._similarity_profile(meta))
+            self._profiles[song_id] = cached
+        return cached[1]
+    
+    @staticmethod
+    def _similarity_profile(meta: Dict[str, Any]) -> Tuple[str, str, str, int, int]:
+        """
+        Extract the fields used for scoring from a metadata dict.
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        
+        Args:
+            meta (Dict[str, Any]): Song metadata
+            
+        Returns:
+            Tuple[str, str, str, int, int]: (genre, subgenre, mood, duration, bpm),
+                with the categorical fields lowercased and interned so that matching
+                values across songs are the same object and compare by identity
+        """
+        return (sys.intern(meta.get('genre', '').lower()),
+                sys.intern(meta.get('subgenre', '').lower()),
+                sys.intern(meta.get('mood', '').lower()),
+                meta.get('duration', 0),
+                meta.get('bpm', 0))
+    
+    def _score_profiles(self, seed_profile: Tuple[str, str, str, int, int],
+                        candidate_profile: Tuple[str, str, str, int, int]) -> Tuple[float, str]:
+        """
+        Score a candidate profile against a seed profile (see _calculate_similarity_score).
+        
+        Time Complexity: O(1)
+        Space Complexity: O(1)
+        
+        Args:
+            seed_profile: Profile of the seed song from _similarity_profile
+            candidate_profile: Profile of the candidate song from _similarity_profile
+            
+        Returns:
+            Tuple[float, str]: (score, reason)
+        """
+        seed_genre, seed_subgenre, seed_mood, seed_duration, seed_bpm = seed_profile
+        candidate_genre, candidate_subgenre, candidate_mood, candidate_duration, candidate_bpm = candidate_profile
         
         # Weight factors
         W_GENRE = 1.0
@@ -183,44 +312,35 @@ class SmartRecommender:
         reasons = []
         
         # Genre match
-        seed_genre = seed_meta.get('genre', '').lower()
-        candidate_genre = candidate_meta.get('genre', '').lower()
         if seed_genre and candidate_genre and seed_genre == candidate_genre:
             score += W_GENRE
             reasons.append("same genre")
         
         # Subgenre match
-        seed_subgenre = seed_meta.get('subgenre', '').lower()
-        candidate_subgenre = candidate_meta.get('subgenre', '').lower()
         if seed_subgenre and candidate_subgenre and seed_subgenre == candidate_subgenre:
             score += W_SUBGENRE
             reasons.append("same subgenre")
         
         # Mood match
-        seed_mood = seed_meta.get('mood', '').lower()
-        candidate_mood = candidate_meta.get('mood', '').lower()
         if seed_mood and candidate_mood and seed_mood == candidate_mood:
             score += W_MOOD
             reasons.append("same mood")
         
-        # Duration similarity
-        seed_duration = seed_meta.get('duration', 0)
-        candidate_duration = candidate_meta.get('duration', 0)
+        # Duration similarity (the linear score is positive exactly when the
+        # difference is within the threshold, so one comparison does both checks)
         if seed_duration > 0 and candidate_duration > 0:
             duration_diff = abs(candidate_duration - seed_duration)
-            if duration_diff <= self.duration_threshold:
-                duration_score = max(0, 1 - duration_diff / self.duration_threshold)
+            duration_score = 1 - duration_diff / self.duration_threshold
+            if duration_score > 0:
                 score += W_DURATION * duration_score
                 if duration_score > 0.5:
                     reasons.append(f"similar duration (±{duration_diff}s)")
         
         # BPM similarity
-        seed_bpm = seed_meta.get('bpm', 0)
-        candidate_bpm = candidate_meta.get('bpm', 0)
         if seed_bpm > 0 and candidate_bpm > 0:
             bpm_diff = abs(candidate_bpm - seed_bpm)
-            if bpm_diff <= self.bpm_threshold:
-                bpm_score = max(0, 1 - bpm_diff / self.bpm_threshold)
+            bpm_score = 1 - bpm_diff / self.bpm_threshold
+            if bpm_score > 0:
                 score += W_BPM * bpm_score
                 if bpm_score > 0.5:
                     reasons.append(f"similar BPM (±{bpm_diff})")
@@ -228,13 +348,43 @@ class SmartRecommender:
         reason = ", ".join(reasons) if reasons else "minimal similarity"
         return score, reason
     
+    def _score_candidates(self, seed_id: str, candidate_ids: Iterable[str]) -> Iterator[Tuple[str, float, str]]:
+        """
+        Score all candidates against a single seed song.
+        
+        The seed's profile is looked up once for the whole batch instead of once
+        per (seed, candidate) pair; profiles are normalized once per song.
+        
+        Time Complexity: O(M) where M is the number of candidates
+        Space Complexity: O(1) additional space
+        
+        Args:
+            seed_id (str): ID of the seed song
+            candidate_ids (Iterable[str]): IDs of the candidate songs
+            
+        Yields:
+            Tuple[str, float, str]: (candidate_id, score, reason) for each candidate
+                with metadata
+        """
+        seed_profile = self._get_profile(seed_id)
+        if seed_profile is None:
+            return
+        
+        get_profile = self._get_profile
+        for candidate_id in candidate_ids:
+            candidate_profile = get_profile(candidate_id)
+            if candidate_profile is None:
+                continue  # Missing metadata scores 0
+            score, reason = self._score_profiles(seed_profile, candidate_profile)
+            yield candidate_id, score, reason
+    
     def recommend(self, seed_count: Optional[int] = None, top_n: Optional[int] = None, 
                   exclude_active_playlist: bool = True) -> List[Recommendation]:
         """
         Generate smart recommendations based on recent play history.
         
         Time Complexity: O(k * M log N) where k=seed_count, M=candidates per seed, N=top_n
-        Space Complexity: O(N) for the result list
+        Space Complexity: O(k * M) for the aggregated scores
         
         Args:
             seed_count (Optional[int]): Number of recent songs to use as seeds
@@ -250,10 +400,12 @@ class SmartRecommender:
         
         # Get recent seed songs (last k played)
         seed_songs = []
+        seen = set()  # O(1) duplicate check instead of scanning seed_songs
         for song_id, timestamp in reversed(self.play_window):
             if len(seed_songs) >= seed_count:
                 break
-            if song_id not in seed_songs:  # Avoid duplicates
+            if song_id not in seen:  # Avoid duplicates
+                seen.add(song_id)
                 seed_songs.append(song_id)
         
         if not seed_songs:
@@ -268,55 +420,58 @@ class SmartRecommender:
             playlist_songs = self.playlist_songs_getter()
             active_playlist_songs = {song.song_id for song in playlist_songs if song.song_id}
         
+        # Recently played and active playlist songs, merged once for all seeds
+        excluded = self.played_set | active_playlist_songs
+        is_recently_skipped = self.skipped_tracker.is_recently_skipped
+        
         # Aggregate candidates and scores across all seeds
         candidate_scores: Dict[str, float] = defaultdict(float)
-        candidate_reasons: Dict[str, List[str]] = defaultdict(list)
+        candidate_reasons: Dict[str, Set[str]] = defaultdict(set)  # Deduplicated as they are added
+        # Explorer search results per criteria, shared across seeds
+        search_cache: Dict[Tuple[Optional[str], ...], Set[str]] = {}
         
         # Debug print
         # print(f"DEBUG: Processing seeds: {seed_songs}")
         
-        for seed_id in seed_songs:
+        # Per-seed weights, computed once per call (seed_songs is most recent first)
+        if self.seed_decay_tau is None:
+            seed_weights = [1.0] * len(seed_songs)
+        else:
+            seed_weights = [math.exp(-rank / self.seed_decay_tau) for rank in range(len(seed_songs))]
+        
+        for seed_id, seed_weight in zip(seed_songs, seed_weights):
             # Get similar songs
-            similar_songs = self._get_similar_songs(seed_id)
+            similar_songs = self._get_similar_songs(seed_id, search_cache)
             
             # Debug print
             # print(f"DEBUG: Seed {seed_id} found similar songs: {similar_songs}")
             
-            # Limit candidates to prevent explosion
-            similar_songs_list = list(similar_songs)[:self.max_candidates_per_seed]
+            # Filter out recently played and active playlist songs in one set difference
+            # (the set returned by _get_similar_songs is ours to modify)
+            similar_songs -= excluded
             
-            # Score each candidate
-            for candidate_id in similar_songs_list:
-                # Skip filtering
-                if candidate_id in self.played_set:
-                    # print(f"DEBUG: Skipping {candidate_id} - in played_set")
-                    continue  # Recently played
-                if self.skipped_tracker.is_recently_skipped(candidate_id):
-                    # print(f"DEBUG: Skipping {candidate_id} - is recently skipped")
-                    continue  # Recently skipped
-                if exclude_active_playlist and candidate_id in active_playlist_songs:
-                    # print(f"DEBUG: Skipping {candidate_id} - in active playlist")
-                    continue  # In active playlist
-                
-                # Calculate similarity score
-                score, reason = self._calculate_similarity_score(seed_id, candidate_id)
-                # print(f"DEBUG: Candidate {candidate_id} got score {score} for seed {seed_id}")
-                
+            # Limit candidates to prevent explosion, pulling only that many from the set;
+            # the skipped tracker only exposes a membership check
+            candidates = [
+                candidate_id for candidate_id in islice(similar_songs, self.max_candidates_per_seed)
+                if not is_recently_skipped(candidate_id)
+            ]
+            
+            # Score the remaining candidates against this seed in one batch
+            for candidate_id, score, reason in self._score_candidates(seed_id, candidates):
                 # Only consider candidates with some similarity
                 if score > 0:
-                    candidate_scores[candidate_id] += score
-                    candidate_reasons[candidate_id].append(reason)
-                # Debug print
-                # else:
-                #     print(f"DEBUG: Candidate {candidate_id} got score {score} for seed {seed_id}")
+                    candidate_scores[candidate_id] += seed_weight * score
+                    candidate_reasons[candidate_id].add(reason)
         
-        # Sort candidates by score and return top N
-        sorted_candidates = sorted(candidate_scores.items(), key=lambda x: x[1], reverse=True)
+        # Select the top N candidates by score without sorting them all
+        # (nlargest is equivalent to a stable sort followed by [:top_n])
+        top_candidates = heapq.nlargest(top_n, candidate_scores.items(), key=itemgetter(1))
         
         recommendations = []
-        for song_id, score in sorted_candidates[:top_n]:
+        for song_id, score in top_candidates:
             # Combine reasons
-            reasons = list(set(candidate_reasons[song_id]))  # Remove duplicates
+            reasons = candidate_reasons[song_id]
             reason = "; ".join(reasons) if reasons else "similar to recent plays"
             
             recommendations.append(Recommendation(
@@ -332,7 +487,8 @@ class SmartRecommender:
         """
         Fallback method to get popular songs when no similar songs found.
         
-        Time Complexity: O(S log S) where S is number of songs with play data
+        Time Complexity: O((N + F) log S) amortized where S is number of songs with
+            play data and F is the number of songs skipped by the filters
         Space Complexity: O(N) for result list
         
         Args:
@@ -345,11 +501,24 @@ class SmartRecommender:
         """
         top_n = top_n or self.top_n
         
-        # Sort songs by total listen time
-        sorted_songs = sorted(self.total_listen_time.items(), key=lambda x: x[1], reverse=True)
+        # Pop songs in order of total listen time until top_n pass the filters
+        heap = self._popularity_heap
+        total_listen_time = self._total_listen_time
+        popped = []  # Current entries to push back afterwards
+        seen = set()
         
         recommendations = []
-        for song_id, total_time in sorted_songs:
+        while heap and len(recommendations) < top_n:
+            entry = heapq.heappop(heap)
+            neg_total, _, song_id = entry
+            total_time = -neg_total
+            
+            # Skip stale entries (lazy deletion)
+            if song_id in seen or total_listen_time.get(song_id) != total_time:
+                continue
+            seen.add(song_id)
+            popped.append(entry)
+            
             # Apply filters
             if exclude_recent and song_id in self.played_set:
                 continue
@@ -361,8 +530,9 @@ class SmartRecommender:
                 score=float(total_time),
                 reason=f"popular song (total listen time: {total_time}s)"
             ))
-            
-            if len(recommendations) >= top_n:
-                break
         
-        return recommendations
\ No newline at end of file
+        # Push back the current entries we popped
+        for entry in popped:
+            heapq.heappush(heap, entry)
+        
+        return recommendations
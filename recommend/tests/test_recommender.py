@@ -267,6 +267,42 @@ def test_seed_aggregation():
     assert isinstance(recommendations, list)
 
 
+def test_seed_decay_favors_recent_seeds():
+    """Test that seed_decay_tau weights candidates of the most recent seed higher."""
+    playlist_explorer = MockPlaylistExplorer()
+    rock = {"genre": "Rock", "duration": 200}
+    pop = {"genre": "Pop", "duration": 200}
+    
+    def make_recommender(seed_decay_tau):
+        recommender = SmartRecommender(
+            playlist_explorer=playlist_explorer,
+            skipped_tracker=MockSkippedTracker(),
+            playlist_songs_getter=MockPlaylist().get_all_songs,
+            seed_decay_tau=seed_decay_tau
+        )
+        recommender.song_metadata["rock_candidate"] = rock
+        recommender.song_metadata["pop_candidate"] = pop
+        current_time = time.time()
+        recommender.record_play("rock_seed", current_time - 100, 200, rock)
+        recommender.record_play("pop_seed", current_time, 200, pop)  # Most recent
+        return recommender
+    
+    for song_id, meta in [("rock_seed", rock), ("pop_seed", pop),
+                          ("rock_candidate", rock), ("pop_candidate", pop)]:
+        playlist_explorer.add_song_to_db(song_id, meta)
+    
+    flat = make_recommender(None).recommend(seed_count=2)
+    assert [rec.score for rec in flat] == [1.5, 1.5]
+    
+    decayed = make_recommender(1.0).recommend(seed_count=2)
+    assert [rec.song_id for rec in decayed] == ["pop_candidate", "rock_candidate"]
+    assert decayed[0].score == 1.5
+    assert decayed[1].score == pytest.approx(1.5 * 0.3679, abs=0.01)
+    
+    with pytest.raises(ValueError):
+        make_recommender(0)
+
+
 def test_window_size_limit():
     """Test that the play window respects size limits."""
     # Create mocks
@@ -311,6 +347,32 @@ def test_window_size_limit():
     # Played set might contain more since we don't evict from it
 
 
+def test_similarity_score_uses_normalized_metadata():
+    """Test that scoring ignores case and picks up metadata assigned directly."""
+    recommender = SmartRecommender(
+        playlist_explorer=MockPlaylistExplorer(),
+        skipped_tracker=MockSkippedTracker(),
+        playlist_songs_getter=MockPlaylist().get_all_songs
+    )
+    
+    recommender.record_play("seed", time.time(), 200, {
+        "genre": "Rock", "subgenre": "Alternative", "mood": "Melancholic", "duration": 200, "bpm": 120
+    })
+    recommender.song_metadata["candidate"] = {
+        "genre": "ROCK", "subgenre": "alternative", "mood": "Upbeat", "duration": 200, "bpm": 120
+    }
+    
+    score, reason = recommender._calculate_similarity_score("seed", "candidate")
+    assert score == pytest.approx(1.0 + 0.8 + 0.5 + 0.4)
+    assert "same mood" not in reason
+    
+    # Replacing the metadata dict is reflected in the next score
+    recommender.song_metadata["candidate"] = dict(recommender.song_metadata["candidate"], mood="melancholic")
+    score, reason = recommender._calculate_similarity_score("seed", "candidate")
+    assert score == pytest.approx(1.0 + 0.8 + 0.6 + 0.5 + 0.4)
+    assert "same mood" in reason
+
+
 def test_fallback_popular_songs():
     """Test the fallback to popular songs when no similar songs found."""
     # Create mocks
@@ -362,5 +424,56 @@ def test_fallback_popular_songs():
         assert popular_songs[0].song_id == "popular1"
 
 
+def test_popular_songs_follow_repeated_plays():
+    """Test that popularity ranking tracks updated listen totals without duplicates."""
+    skipped_tracker = MockSkippedTracker()
+    recommender = SmartRecommender(
+        playlist_explorer=MockPlaylistExplorer(),
+        skipped_tracker=skipped_tracker,
+        playlist_songs_getter=MockPlaylist().get_all_songs
+    )
+    
+    current_time = time.time()
+    for _ in range(10):
+        recommender.record_play("a", current_time, 10)
+        recommender.record_play("b", current_time, 15)
+    recommender.record_play("c", current_time, 120)
+    recommender.record_play("a", current_time, 100)
+    
+    popular = recommender.get_popular_songs(exclude_recent=False, top_n=5)
+    assert [(rec.song_id, rec.score) for rec in popular] == [("a", 200.0), ("b", 150.0), ("c", 120.0)]
+    
+    # Filtered songs are skipped but stay ranked for later calls
+    skipped_tracker.skip_song("a")
+    popular = recommender.get_popular_songs(exclude_recent=False, top_n=1)
+    assert [rec.song_id for rec in popular] == ["b"]
+    popular = recommender.get_popular_songs(exclude_recent=False, exclude_skipped=False, top_n=1)
+    assert [rec.song_id for rec in popular] == ["a"]
+
+
+def test_total_listen_time_is_read_only():
+    """Test that listen totals can only change through record_play, keeping rankings current."""
+    recommender = SmartRecommender(
+        playlist_explorer=MockPlaylistExplorer(),
+        skipped_tracker=MockSkippedTracker(),
+        playlist_songs_getter=MockPlaylist().get_all_songs
+    )
+    
+    current_time = time.time()
+    recommender.record_play("a", current_time, 10)
+    recommender.record_play("b", current_time, 30)
+    assert dict(recommender.total_listen_time) == {"a": 10, "b": 30}
+    
+    with pytest.raises(TypeError):
+        recommender.total_listen_time["seeded"] = 500
+    with pytest.raises(TypeError):
+        recommender.total_listen_time["a"] += 1000
+    
+    # Read straight from the lazy heap, without a rebuild in between
+    recommender.record_play("a", current_time, 25)
+    popular = recommender.get_popular_songs(exclude_recent=False, top_n=5)
+    assert [(rec.song_id, rec.score) for rec in popular] == [("a", 35.0), ("b", 30.0)]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -4,14 +4,16 @@ Duplicate Cleaner module for PlayWise Music Engine.
 Detects and handles duplicate songs based on normalized title+artist composite keys.
 """
 
-import re
-from typing import Dict, Optional, Literal
+from typing import Dict, Iterable, List, Optional, Literal, Tuple
 from playlist.song import Song
 
+# Marks a missing entry, since None is a valid registered song_id
+_MISSING = object()
+
 
 def normalize(text: str) -> str:
     """
-    Normalize text by stripping, converting to lowercase, and collapsing whitespace.
+    Normalize text by stripping, case-folding, and collapsing whitespace.
     
     Args:
         text (str): Text to normalize
@@ -21,8 +23,16 @@ def normalize(text: str) -> str:
     """
     if not text:
         return ""
-    # Strip whitespace, convert to lowercase, and collapse multiple spaces to single space
-    return re.sub(r'\s+', ' ', text.strip().lower())
+    # Strip whitespace, case-fold, and collapse multiple spaces to single space.
+    # casefold() costs the same as lower() but also matches caseless forms
+    # such as "ß" and "ss"
+    text = text.strip().casefold()
+    # Only ASCII space is printable whitespace, so printable text without a double
+    # space has nothing to collapse
+    if '  ' in text or not text.isprintable():
+        # split() breaks on the same characters as the regex \s and drops empty parts
+        text = ' '.join(text.split())
+    return text
 
 
 class DuplicateCleaner:
@@ -34,6 +44,7 @@ class DuplicateCleaner:
         - register: O(1) average case
         - deregister: O(1) average case
         - cleanup_on_add: O(1) average case
+        - cleanup_on_add_many: O(n) average case for n songs
     
     Space Complexity:
         - O(S) where S is the number of unique songs
@@ -50,20 +61,36 @@ class DuplicateCleaner:
         """
         self.keep = keep
         # Map composite key to song_id for O(1) duplicate detection
-        self.key_to_song_id: Dict[str, str] = {}
+        self.key_to_song_id: Dict[Tuple[str, str], str] = {}
+        # Reverse index: song_id to the key it was last registered under,
+        # so removal needs neither title/artist nor re-normalization
+        self.id_to_key: Dict[str, Tuple[str, str]] = {}
     
-    def _make_key(self, title: str, artist: str) -> str:
+    def _make_key(self, title: str, artist: str) -> Tuple[str, str]:
         """
         Create a normalized composite key from title and artist.
         
+        A tuple hashes its parts without building a joined string, and cannot
+        collide when a title or artist contains a separator character.
+        
         Args:
             title (str): Song title
             artist (str): Song artist
             
         Returns:
-            str: Normalized composite key
+            Tuple[str, str]: Normalized (title, artist) composite key
+        """
+        return (normalize(title), normalize(artist))
+    
+    def _song_key(self, song: Song) -> Tuple[str, str]:
+        """
+        Return the composite key of a song, normalizing its title and artist
+        only the first time the song is seen (the key is cached on the song).
         """
-        return f"{normalize(title)}|{normalize(artist)}"
+        key = song.dedupe_key
+        if key is None:
+            key = song.dedupe_key = self._make_key(song.title, song.artist)
+        return key
     
     def is_duplicate(self, title: str, artist: str) -> bool:
         """
@@ -94,23 +121,39 @@ class DuplicateCleaner:
             title (str): Song title
             artist (str): Song artist
         """
-        key = self._make_key(title, artist)
+        self._register_key(song_id, self._make_key(title, artist))
+    
+    def _register_key(self, song_id: str, key: Tuple[str, str]) -> None:
+        """
+        Map key to song_id and record the reverse entry.
+        """
         self.key_to_song_id[key] = song_id
+        if song_id is not None:
+            self.id_to_key[song_id] = key
     
-    def deregister(self, song_id: str, title: str, artist: str) -> None:
+    def deregister(self, song_id: str, title: Optional[str] = None, artist: Optional[str] = None) -> None:
         """
         Remove a song from the registry.
         
+        The key is found through the reverse index; title and artist are only
+        used for songs that were never registered under song_id. A key that has
+        since been taken over by another song (keep='latest') is left in place.
+        
         Time Complexity: O(1) average case
         Space Complexity: O(1)
         
         Args:
             song_id (str): Unique identifier for the song
-            title (str): Song title
-            artist (str): Song artist
+            title (Optional[str]): Song title (optional)
+            artist (Optional[str]): Song artist (optional)
         """
-        key = self._make_key(title, artist)
-        if key in self.key_to_song_id:
+        key = self.id_to_key.pop(song_id, None)
+        if key is None:
+            if title is None and artist is None:
+                return
+            key = self._make_key(title, artist)
+        # One probe for both the presence and the owner check
+        if self.key_to_song_id.get(key, _MISSING) == song_id:
             del self.key_to_song_id[key]
     
     def cleanup_on_add(self, song_obj: Song) -> Optional[str]:
@@ -126,19 +169,51 @@ class DuplicateCleaner:
         Returns:
             Optional[str]: None if song can be added, existing song_id if duplicate and keep='first'
         """
-        # Check if this is a duplicate
-        if self.is_duplicate(song_obj.title, song_obj.artist):
-            key = self._make_key(song_obj.title, song_obj.artist)
-            existing_song_id = self.key_to_song_id[key]
+        # Build the key at most once per song and probe the registry once
+        key = self._song_key(song_obj)
+        existing_song_id = self.key_to_song_id.get(key)
+        
+        # A song registered without an id cannot be returned as the existing one,
+        # so it is replaced like a new registration
+        if existing_song_id is not None and self.keep == 'first':
+            # Duplicate: reject the new song, return the existing one
+            return existing_song_id
+        
+        # Register the new song; with keep='latest' this replaces the old
+        # registration (caller should handle actual removal)
+        self._register_key(song_obj.song_id, key)
+        return None
+    
+    def cleanup_on_add_many(self, songs: Iterable[Song]) -> List[Song]:
+        """
+        Apply cleanup_on_add to each song in order, returning those that can be added.
+        
+        Time Complexity: O(n) average case for n songs
+        Space Complexity: O(n)
+        
+        Args:
+            songs (Iterable[Song]): Song objects to be added
             
-            if self.keep == 'first':
-                # Reject the new song, return the existing one
-                return existing_song_id
-            elif self.keep == 'latest':
-                # Remove the old song registration (caller should handle actual removal)
-                # Just deregister the old one, caller will handle the rest
-                pass
-                
-        # Register the new song
-        self.register(song_obj.song_id, song_obj.title, song_obj.artist)
-        return None
\ No newline at end of file
+        Returns:
+            List[Song]: Songs accepted (and registered), in input order
+        """
+        # Bind the registries and policy once; the loop body inlines
+        # _song_key, cleanup_on_add and _register_key
+        key_to_song_id = self.key_to_song_id
+        id_to_key = self.id_to_key
+        make_key = self._make_key
+        keep_first = self.keep == 'first'
+        accepted = []
+        append = accepted.append
+        for song in songs:
+            key = song.dedupe_key
+            if key is None:
+                key = song.dedupe_key = make_key(song.title, song.artist)
+            if keep_first and key_to_song_id.get(key) is not None:
+                continue
+            song_id = song.song_id
+            key_to_song_id[key] = song_id
+            if song_id is not None:
+                id_to_key[song_id] = key
+            append(song)
+        return accepted
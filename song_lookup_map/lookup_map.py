@@ -1,6 +1,6 @@
 from playlist.song import Song
-from typing import Optional
-from .duplicate_cleaner import DuplicateCleaner
+from typing import Dict, Iterable, List, Optional
+from .duplicate_cleaner import DuplicateCleaner, normalize
 
 
 class SongLookupMap:
@@ -18,8 +18,9 @@ class SongLookupMap:
         """
         # Maps song_id to Song object
         self.id_map = {}
-        # Maps song title to Song object
-        self.title_map = {}
+        # Maps normalized song title to the Song objects with that title, oldest first
+        # (same normalization as the duplicate key, so "Imagine" and "imagine " match)
+        self.title_map: Dict[str, List[Song]] = {}
         # Duplicate cleaner
         self.enable_dedupe = enable_dedupe
         if enable_dedupe:
@@ -47,14 +48,45 @@ class SongLookupMap:
         # Add to maps
         if song.song_id is not None:
             self.id_map[song.song_id] = song
-        # If multiple songs can have same title, use a list; here we assume unique
-        self.title_map[song.title] = song
+        # Several songs can share a title (e.g. different artists)
+        # (cleanup_on_add above already registered the song with the duplicate cleaner)
+        self.title_map.setdefault(self._title_key(song), []).append(song)
         
-        # Register with duplicate cleaner if enabled
+        return None
+
+    def add_songs(self, songs: Iterable[Song]) -> List[Song]:
+        """
+        Add several songs, with the same deduplication as calling add_song on each in order.
+        
+        Duplicate checks run in one pass over the input; the id map is then
+        filled with a single batch update.
+        
+        Args:
+            songs (Iterable[Song]): Song objects to add
+            
+        Returns:
+            List[Song]: The songs that were added, in input order (duplicates
+                rejected by the 'first' policy are left out)
+        """
         if self.enable_dedupe and self.duplicate_cleaner:
-            self.duplicate_cleaner.register(song.song_id, song.title, song.artist)
+            added = self.duplicate_cleaner.cleanup_on_add_many(songs)
+        else:
+            added = list(songs)
         
-        return None
+        self.id_map.update({song.song_id: song for song in added if song.song_id is not None})
+        title_map = self.title_map
+        title_key = self._title_key
+        for song in added:
+            title_map.setdefault(title_key(song), []).append(song)
+        return added
+
+    @staticmethod
+    def _title_key(song: Song) -> str:
+        """
+        Normalized title of a song, reusing its cached duplicate key when available.
+        """
+        key = song.dedupe_key
+        return key[0] if key is not None else normalize(song.title)
 
     def remove_song(self, song_id: str) -> bool:
         """
@@ -62,13 +94,24 @@ class SongLookupMap:
         Returns True if successful, False if not found.
         """
         song = self.id_map.pop(song_id, None)
-        if song and song.title in self.title_map:
-            del self.title_map[song.title]
-            # Deregister from duplicate cleaner if enabled
-            if self.enable_dedupe and self.duplicate_cleaner:
-                self.duplicate_cleaner.deregister(song_id, song.title, song.artist)
-            return True
-        return False
+        if song is None:
+            return False
+        
+        # Remove only this song; others with the same title stay findable
+        title = self._title_key(song)
+        same_title = self.title_map.get(title)
+        if same_title is not None:
+            for i, candidate in enumerate(same_title):
+                if candidate is song:
+                    del same_title[i]
+                    break
+            if not same_title:
+                del self.title_map[title]
+        
+        # Deregister from duplicate cleaner if enabled
+        if self.enable_dedupe and self.duplicate_cleaner:
+            self.duplicate_cleaner.deregister(song_id)
+        return True
 
     def lookup_song_by_id(self, song_id: str) -> Optional[Song]:
         """
@@ -79,5 +122,8 @@ class SongLookupMap:
     def lookup_song_by_title(self, title: str) -> Optional[Song]:
         """
         Return the Song with given title, or None if not found.
+        Titles match ignoring case and extra whitespace. If several songs
+        share the title, the most recently added one is returned.
         """
-        return self.title_map.get(title, None)
\ No newline at end of file
+        same_title = self.title_map.get(normalize(title))
+        return same_title[-1] if same_title else None
\ No newline at end of file
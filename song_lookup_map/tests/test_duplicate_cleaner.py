@@ -20,6 +20,9 @@ def test_normalize():
     assert normalize("Hello\nWorld") == "hello world"
     assert normalize("  HELLO   WORLD  ") == "hello world"
     
+    # Test caseless matching beyond lowercase
+    assert normalize("Straße") == normalize("STRASSE")
+
     # Test edge cases
     assert normalize("") == ""
     assert normalize("   ") == ""
@@ -88,6 +91,10 @@ def test_is_duplicate():
     # Different song should not be duplicate
     assert not cleaner.is_duplicate("Different Song", "Artist")
 
+    # Separator characters inside fields must not make keys collide
+    cleaner.register("2", "A|B", "C")
+    assert not cleaner.is_duplicate("A", "B|C")
+
 
 def test_register_and_deregister():
     """Test register and deregister methods."""
@@ -106,5 +113,38 @@ def test_register_and_deregister():
     assert not cleaner.is_duplicate("Non-existent", "Song")
 
 
+def test_deregister_by_song_id():
+    """Test deregistering through the reverse song_id index."""
+    cleaner = DuplicateCleaner(keep='latest')
+
+    cleaner.cleanup_on_add(Song("Hello", "Artist", 180, song_id="1"))
+    cleaner.deregister("1")
+    assert not cleaner.is_duplicate("Hello", "Artist")
+    assert "1" not in cleaner.id_to_key
+
+    # Removing a replaced song keeps the key registered to its replacement
+    cleaner.cleanup_on_add(Song("Hello", "Artist", 180, song_id="1"))
+    cleaner.cleanup_on_add(Song("hello ", "ARTIST", 200, song_id="2"))
+    cleaner.deregister("1")
+    assert cleaner.key_to_song_id[cleaner._make_key("Hello", "Artist")] == "2"
+    cleaner.deregister("2")
+    assert not cleaner.is_duplicate("Hello", "Artist")
+
+
+def test_song_key_is_cached_on_song():
+    """Test that a song's composite key is computed once and reused."""
+    cleaner = DuplicateCleaner()
+    song = Song("  Hello ", "Artist", 180, song_id="1")
+
+    assert song.dedupe_key is None
+    cleaner.cleanup_on_add(song)
+    assert song.dedupe_key == cleaner._make_key("Hello", "Artist")
+
+    # A second cleaner reuses the cached key and still detects the duplicate
+    other = DuplicateCleaner()
+    other.cleanup_on_add(song)
+    assert other.cleanup_on_add(Song("hello", "ARTIST", 200, song_id="2")) == "1"
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file
@@ -93,5 +93,47 @@ class TestSongLookupMap(unittest.TestCase):
         result = self.lookup.lookup_song_by_title("Bohemian Rhapsody")
         self.assertEqual(result, song2_alt)
 
+    def test_remove_song_keeps_other_songs_with_same_title(self):
+        """
+        Removing one of several songs sharing a title leaves the others findable.
+        """
+        self.lookup.add_song(self.song2)
+        song2_alt = Song("Bohemian Rhapsody", "Queen Live", 400, song_id=22)
+        self.lookup.add_song(song2_alt)
+
+        self.assertTrue(self.lookup.remove_song(22))
+        self.assertEqual(self.lookup.lookup_song_by_title("Bohemian Rhapsody"), self.song2)
+
+        self.assertTrue(self.lookup.remove_song(2))
+        self.assertIsNone(self.lookup.lookup_song_by_title("Bohemian Rhapsody"))
+        # Both songs were deregistered, so they can be added again
+        self.assertIsNone(self.lookup.add_song(self.song2))
+
+    def test_lookup_by_title_ignores_case_and_spacing(self):
+        """
+        Title lookup should use the same normalization as duplicate detection.
+        """
+        self.lookup.add_song(self.song2)
+        self.assertEqual(self.lookup.lookup_song_by_title("  bohemian   RHAPSODY "), self.song2)
+
+        self.assertTrue(self.lookup.remove_song(2))
+        self.assertEqual(self.lookup.title_map, {})
+
+    def test_add_songs_skips_duplicates(self):
+        """
+        Batch add should keep the first of each duplicate, like repeated add_song calls.
+        """
+        self.lookup.add_song(self.song1)
+        imagine_copy = Song("imagine", "JOHN LENNON", 190, song_id=11)
+        song3_copy = Song("Hey Jude", "The Beatles", 431, song_id=33)
+
+        added = self.lookup.add_songs([self.song2, imagine_copy, self.song3, song3_copy])
+
+        self.assertEqual(added, [self.song2, self.song3])
+        self.assertIsNone(self.lookup.lookup_song_by_id(11))
+        self.assertIsNone(self.lookup.lookup_song_by_id(33))
+        self.assertEqual(self.lookup.lookup_song_by_id(3), self.song3)
+        self.assertEqual(self.lookup.lookup_song_by_title("Bohemian Rhapsody"), self.song2)
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,42 +1,44 @@
-from song_rating_tree.bst_node import BSTNode
+from song_rating_tree.rating_bucket import RatingBucket
+
+# Valid ratings: integers 1 to 5 inclusive
+MIN_RATING = 1
+MAX_RATING = 5
+_VALID_RATINGS = range(MIN_RATING, MAX_RATING + 1)
+
 
 class RatingBST:
     """
-    Binary Search Tree that organizes and enables fast access to
-    buckets of songs grouped by rating value.
+    Organizes and enables fast access to buckets of songs grouped by
+    rating value.
+
+    Ratings are constrained to 1-5, so the buckets live in a fixed array
+    indexed by rating - 1 rather than in a binary search tree: insert and
+    search are a single list index instead of a tree walk. (The class keeps
+    its original name for compatibility.)
     """
     def __init__(self):
-        # Root node of the BST (can be None if tree is empty)
-        self.root = None
+        # Bucket per rating, created on first insert (None: rating never used)
+        self.buckets = [None] * MAX_RATING
+        # Reverse index: song_id -> indices of the buckets holding that id
+        # (a set, since the same id may be inserted under several ratings)
+        self.id_to_buckets = {}
 
     def insert_song(self, song, rating):
         """
-        Insert a Song into the correct rating bucket/node.
+        Insert a Song into the correct rating bucket.
 
         :param song: Song object to insert
         :param rating: Int from 1 to 5 (the rating)
         :raises ValueError: If rating is outside 1 to 5
         """
-        if rating < 1 or rating > 5:
+        if rating not in _VALID_RATINGS:
             raise ValueError(f"Invalid rating {rating}: must be between 1 and 5 inclusive.")
-        self.root = self._insert(self.root, song, rating)
-
-
-    def _insert(self, node, song, rating):
-        # If this subtree is empty, make a new BSTNode
-        if node is None:
-            new_node = BSTNode(rating)
-            new_node.bucket.add_song(song)
-            return new_node
-
-        # If rating is lower, insert left; if higher, insert right
-        if rating < node.rating:
-            node.left = self._insert(node.left, song, rating)
-        elif rating > node.rating:
-            node.right = self._insert(node.right, song, rating)
-        else:  # rating == node.rating, add song to the rating's bucket
-            node.bucket.add_song(song)
-        return node
+        index = int(rating) - MIN_RATING
+        bucket = self.buckets[index]
+        if bucket is None:
+            bucket = self.buckets[index] = RatingBucket(int(rating))
+        bucket.add_song(song)
+        self.id_to_buckets.setdefault(song.song_id, set()).add(index)
 
     def search_by_rating(self, rating):
         """
@@ -45,29 +47,28 @@ class RatingBST:
         :param rating: Int rating to search for
         :return: List[Song]
         """
-        node = self.root
-        while node:
-            if rating < node.rating:
-                node = node.left
-            elif rating > node.rating:
-                node = node.right
-            else:
-                # Found the rating bucket; return copies of songs
-                return node.bucket.get_songs()
-        # If not found, return empty list
-        return []
+        if rating not in _VALID_RATINGS:
+            return []
+        bucket = self.buckets[int(rating) - MIN_RATING]
+        # Return copies of songs, or an empty list if the rating is unused
+        return bucket.get_songs() if bucket is not None else []
 
     def delete_song(self, song_id):
         """
         Remove a song (by song_id) from all buckets.
 
+        Only the buckets recorded for song_id in the reverse index are
+        touched; unknown ids return without scanning any bucket.
+
         :param song_id: Song's unique identifier
         """
-        self._delete_song(self.root, song_id)
+        for index in self.id_to_buckets.pop(song_id, ()):
+            self.buckets[index].remove_song(song_id)
 
-    def _delete_song(self, node, song_id):
-        if node is not None:
-            node.bucket.remove_song(song_id)
-            # Recursively delete in left and right subtrees
-            self._delete_song(node.left, song_id)
-            self._delete_song(node.right, song_id)
+    def iter_buckets(self):
+        """
+        Yield the buckets of all ratings used so far, in ascending rating order.
+
+        :return: Iterator[RatingBucket]
+        """
+        return (bucket for bucket in self.buckets if bucket is not None)
@@ -9,6 +9,10 @@ class RatingBucket:
         # List of Song objects in this bucket
         self.songs = []
 
+        # song_id of each entry in self.songs, at the same index, so id
+        # scans run over a flat list without touching the Song objects
+        self.ids = []
+
     def add_song(self, song):
         """
         Add a song to this rating bucket.
@@ -16,6 +20,7 @@ class RatingBucket:
         :param song: Song object (must have .song_id attribute)
         """
         self.songs.append(song)
+        self.ids.append(song.song_id)
 
     def remove_song(self, song_id):
         """
@@ -23,7 +28,16 @@ class RatingBucket:
 
         :param song_id: ID of the song to be removed
         """
-        self.songs = [s for s in self.songs if s.song_id != song_id]
+        ids = self.ids
+        index = 0
+        # Remove every entry with this id, keeping the order of the rest
+        while True:
+            try:
+                index = ids.index(song_id, index)
+            except ValueError:
+                return
+            del ids[index]
+            del self.songs[index]
 
     def get_songs(self):
         """
@@ -101,6 +101,20 @@ class TestSongRatingEngine(unittest.TestCase):
         self.assertIn(self.song1, bucket_5)
         self.assertIn(duplicate_song, bucket_3)
 
+    def test_delete_duplicate_id_removes_from_every_bucket(self):
+        """
+        Deleting a song_id inserted under several ratings should clear all of them.
+        """
+        duplicate_song = Song("Fake Title", "Fake Artist", 123, song_id=1)
+        self.engine.insert_song(self.song1, rating=5)
+        self.engine.insert_song(duplicate_song, rating=3)
+        self.engine.insert_song(self.song2, rating=3)
+
+        self.engine.delete_song(1)
+
+        self.assertEqual(self.engine.search_by_rating(5), [])
+        self.assertEqual(self.engine.search_by_rating(3), [self.song2])
+
     def test_insert_invalid_rating_ignored_or_handled(self):
         """
         Optionally test behavior if invalid rating (<1 or >5) is inserted.
@@ -1,10 +1,15 @@
-from typing import Dict, List, Any
+import heapq
+from itertools import islice
+from typing import Dict, List, Any, Optional
 from playlist.song import Song
 from playlist.playlist import Playlist
 from playback_history.playback_controller import PlaybackController
 from song_rating_tree.song_rating_engine import SongRatingEngine
 from song_lookup_map.lookup_map import SongLookupMap
-from playlist_sorting.sort_engine import SortEngine, SortCriteria
+
+# Horizontal rules for the printed reports
+_RULE_50 = "=" * 50
+_RULE_60 = "=" * 60
 
 class SystemDashboard:
     """
@@ -24,101 +29,102 @@ class SystemDashboard:
         self.playback_controller = playback_controller
         self.rating_engine = rating_engine
         self.lookup_map = lookup_map
-        self.sort_engine = SortEngine()
+        # History stack resolved once; controllers do not swap it out after construction
+        self._history_stack = self._find_history_stack(playback_controller)
     
-    def get_top_longest_songs(self, top_n: int = 5) -> List[Song]:
+    @staticmethod
+    def _find_history_stack(playback_controller):
+        """
+        Locate the playback history stack on the controller, or None if it has none.
         """
-        Get top N longest songs from playlist using sorting.
+        if hasattr(playback_controller, 'history'):
+            return playback_controller.history.history_stack
+        if hasattr(playback_controller, 'history_stack'):
+            return playback_controller.history_stack
+        if hasattr(playback_controller, 'playback_history'):
+            return playback_controller.playback_history.history_stack
+        return None
+    
+    def _songs(self, songs: Optional[List[Song]]) -> List[Song]:
+        """
+        Return the given playlist snapshot, or take a fresh one from the playlist.
         
-        Time Complexity: O(n log n)
-        Space Complexity: O(n)
+        Time Complexity: O(1) if songs is given, otherwise O(n)
         """
-        all_songs = self.playlist.get_all_songs()
+        return songs if songs is not None else self.playlist.get_all_songs()
+    
+    def get_top_longest_songs(self, top_n: int = 5, songs: Optional[List[Song]] = None) -> List[Song]:
+        """
+        Get top N longest songs from playlist using heap selection.
+        Songs of equal duration keep their playlist order, as with a stable sort.
+        
+        Time Complexity: O(n log k) where k = top_n
+        Space Complexity: O(k)
+        
+        :param top_n: Number of songs to return
+        :param songs: Playlist snapshot to use instead of fetching one
+        """
+        all_songs = self._songs(songs)
         if not all_songs:
             return []
         
-        sorted_songs = self.sort_engine.merge_sort(all_songs, SortCriteria.DURATION_DESC)
-        return sorted_songs[:min(top_n, len(sorted_songs))]
+        # Equivalent to sorted(..., reverse=True)[:top_n] without sorting everything
+        return heapq.nlargest(top_n, all_songs, key=lambda s: s.duration)
     
     def get_recently_played_songs(self, count: int = 5) -> List[Song]:
         """
         Get most recently played songs from playback history.
         Works with linked list stack implementation.
     
-        Time Complexity: O(n)
-        Space Complexity: O(n)
+        Time Complexity: O(count)
+        Space Complexity: O(count)
     
         :param count: Number of recent songs to return
         :return: List of recently played songs (most recent first)
         """
-        result = []
-        current = None
-
-        # Access the Stack instance
-        if hasattr(self.playback_controller, 'history'):
-            stack_obj = self.playback_controller.history.history_stack
-        elif hasattr(self.playback_controller, 'history_stack'):
-            stack_obj = self.playback_controller.history_stack
-        elif hasattr(self.playback_controller, 'playback_history'):
-            stack_obj = self.playback_controller.playback_history.history_stack
-        else:
+        stack_obj = self._history_stack
+        if stack_obj is None:
             return []
 
-        # The stack instance is linked list based
-        # Start from top node
-        current = stack_obj.top if hasattr(stack_obj, 'top') else None
-
-        # Traverse up to 'count' nodes
-        while current and len(result) < count:
-            result.append(current.song)
-            current = current.next
-
-        return result  # Already from newest to oldest
+        # The stack iterates its linked list from the top node;
+        # islice stops the walk after 'count' songs
+        return list(islice(stack_obj, max(count, 0)))  # Already from newest to oldest
 
     
     def get_song_count_by_rating(self) -> Dict[int, int]:
         """
-        Get count of songs for each rating using BST traversal.
+        Get count of songs for each rating from the rating buckets.
         
-        Time Complexity: O(n)
-        Space Complexity: O(k) where k = number of unique ratings
+        Time Complexity: O(k) where k = number of ratings used
+        Space Complexity: O(k) where k = number of ratings used
         """
-        rating_counts = {}
-        
-        def traverse_and_count(node):
-            """Recursive in-order traversal to count songs per rating."""
-            if node is None:
-                return
-            
-            traverse_and_count(node.left)
-            
-            # Count songs in this rating bucket
-            song_count = len(node.bucket.songs)
-            rating_counts[node.rating] = song_count
-            
-            traverse_and_count(node.right)
-        
-        traverse_and_count(self.rating_engine.bst.root)
-        return rating_counts
+        # Buckets come in ascending rating order, matching the former in-order traversal
+        return {bucket.rating: len(bucket.songs)
+                for bucket in self.rating_engine.bst.iter_buckets()}
     
-    def get_total_playlist_duration(self) -> int:
+    def get_total_playlist_duration(self, songs: Optional[List[Song]] = None) -> int:
         """
         Calculate total duration of all songs.
         
         Time Complexity: O(n)
-        Space Complexity: O(1)
+        Space Complexity: O(n) for the temporary list of durations
+        
+        :param songs: Playlist snapshot to use instead of fetching one
         """
-        all_songs = self.playlist.get_all_songs()
-        return sum(song.duration for song in all_songs)
+        all_songs = self._songs(songs)
+        # A list comprehension feeds sum() faster than a generator (no per-item resume)
+        return sum([song.duration for song in all_songs])
     
-    def get_playlist_statistics(self) -> Dict[str, Any]:
+    def get_playlist_statistics(self, songs: Optional[List[Song]] = None) -> Dict[str, Any]:
         """
         Get comprehensive playlist statistics.
         
         Time Complexity: O(n)
         Space Complexity: O(1)
+        
+        :param songs: Playlist snapshot to use instead of fetching one
         """
-        all_songs = self.playlist.get_all_songs()
+        all_songs = self._songs(songs)
         
         if not all_songs:
             return {
@@ -129,17 +135,43 @@ class SystemDashboard:
                 'longest_song': None
             }
         
-        durations = [song.duration for song in all_songs]
+        total_duration, shortest_song, longest_song = self._duration_summary(all_songs)
         
         return {
             'total_songs': len(all_songs),
-            'total_duration': sum(durations),
-            'avg_duration': sum(durations) // len(durations),
-            'shortest_song': min(all_songs, key=lambda s: s.duration),
-            'longest_song': max(all_songs, key=lambda s: s.duration)
+            'total_duration': total_duration,
+            'avg_duration': total_duration // len(all_songs),
+            'shortest_song': shortest_song,
+            'longest_song': longest_song
         }
     
-    def get_play_duration_visualization(self) -> Dict[str, Any]:
+    @staticmethod
+    def _duration_summary(songs: List[Song]):
+        """
+        Total duration plus shortest and longest song, in a single pass.
+        Ties keep the earliest song, as min()/max() do.
+        
+        Time Complexity: O(n)
+        Space Complexity: O(1)
+        
+        :param songs: Non-empty list of songs
+        :return: Tuple (total_duration, shortest_song, longest_song)
+        """
+        iterator = iter(songs)
+        shortest = longest = next(iterator)
+        total = lowest = highest = shortest.duration
+        for song in iterator:
+            duration = song.duration
+            total += duration
+            if duration < lowest:
+                lowest = duration
+                shortest = song
+            elif duration > highest:
+                highest = duration
+                longest = song
+        return total, shortest, longest
+    
+    def get_play_duration_visualization(self, songs: Optional[List[Song]] = None) -> Dict[str, Any]:
         """
         Get play duration visualization data including total playtime, longest song, and shortest song.
         
@@ -148,10 +180,13 @@ class SystemDashboard:
         Time Complexity: O(n) where n is the number of songs
         Space Complexity: O(1)
         
+        Args:
+            songs (Optional[List[Song]]): Playlist snapshot to use instead of fetching one
+        
         Returns:
             Dict[str, Any]: Visualization data including total, min, and max durations
         """
-        all_songs = self.playlist.get_all_songs()
+        all_songs = self._songs(songs)
         
         if not all_songs:
             return {
@@ -161,12 +196,8 @@ class SystemDashboard:
                 'song_count': 0
             }
         
-        # Use aggregation logic to calculate total playtime
-        total_playtime = sum(song.duration for song in all_songs)
-        
-        # Use min/max tracking to find shortest and longest songs
-        shortest_song = min(all_songs, key=lambda s: s.duration)
-        longest_song = max(all_songs, key=lambda s: s.duration)
+        # Aggregate total playtime and track min/max in one pass
+        total_playtime, shortest_song, longest_song = self._duration_summary(all_songs)
         
         return {
             'total_playtime': total_playtime,
@@ -192,54 +223,57 @@ class SystemDashboard:
         """
         viz_data = self.get_play_duration_visualization()
         
-        print("\n" + "="*50)
-        print("           PLAY DURATION VISUALIZATION")
-        print("="*50)
+        # Collect the report and print it in one call rather than line by line
+        lines = ["\n" + _RULE_50,
+                 "           PLAY DURATION VISUALIZATION",
+                 _RULE_50]
         
         if viz_data['song_count'] == 0:
-            print("No songs in playlist")
-            print("="*50 + "\n")
+            lines.append("No songs in playlist")
+            lines.append(_RULE_50 + "\n")
+            print("\n".join(lines))
             return
         
         # Display total playtime
         total_seconds = viz_data['total_playtime']
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        print(f"Total Playtime: {hours}h {minutes}m {seconds}s ({total_seconds} seconds)")
+        hours, remainder = divmod(total_seconds, 3600)
+        minutes, seconds = divmod(remainder, 60)
+        lines.append(f"Total Playtime: {hours}h {minutes}m {seconds}s ({total_seconds} seconds)")
         
         # Display song count
-        print(f"Total Songs: {viz_data['song_count']}")
+        lines.append(f"Total Songs: {viz_data['song_count']}")
         
         # Display longest song
         longest = viz_data['longest_song']
-        print(f"\nLongest Song:")
-        print(f"  • {longest['title']} by {longest['artist']} ({longest['duration']} seconds)")
+        lines.append("\nLongest Song:")
+        lines.append(f"  • {longest['title']} by {longest['artist']} ({longest['duration']} seconds)")
         
         # Display shortest song
         shortest = viz_data['shortest_song']
-        print(f"\nShortest Song:")
-        print(f"  • {shortest['title']} by {shortest['artist']} ({shortest['duration']} seconds)")
+        lines.append("\nShortest Song:")
+        lines.append(f"  • {shortest['title']} by {shortest['artist']} ({shortest['duration']} seconds)")
         
-        print("="*50 + "\n")
+        lines.append(_RULE_50 + "\n")
+        print("\n".join(lines))
     
     def export_snapshot(self) -> Dict[str, Any]:
         """
         Export complete system snapshot for debugging and monitoring.
         
-        Time Complexity: O(n log n)
+        Time Complexity: O(n)
         Space Complexity: O(n)
         """
-        top_longest = self.get_top_longest_songs(5)
+        # Copy the playlist once and share it between the sections below
+        all_songs = self.playlist.get_all_songs()
+        top_longest = self.get_top_longest_songs(5, all_songs)
         recently_played = self.get_recently_played_songs(5)
         rating_distribution = self.get_song_count_by_rating()
-        stats = self.get_playlist_statistics()
+        stats = self.get_playlist_statistics(all_songs)
+        shortest = stats['shortest_song']
+        longest = stats['longest_song']
         
-        # Get history count safely
-        try:
-            history_count = len(self.playback_controller.history_stack.items)
-        except:
-            history_count = 0
+        # The stack keeps its own size counter, so no traversal is needed
+        history_count = getattr(self._history_stack, 'size', 0)
         
         snapshot = {
             'timestamp': self._get_current_timestamp(),
@@ -270,12 +304,12 @@ class SystemDashboard:
             'song_count_by_rating': rating_distribution,
             'extremes': {
                 'shortest_song': {
-                    'title': stats['shortest_song'].title if stats['shortest_song'] else None,
-                    'duration': stats['shortest_song'].duration if stats['shortest_song'] else None
+                    'title': shortest.title if shortest else None,
+                    'duration': shortest.duration if shortest else None
                 },
                 'longest_song': {
-                    'title': stats['longest_song'].title if stats['longest_song'] else None,
-                    'duration': stats['longest_song'].duration if stats['longest_song'] else None
+                    'title': longest.title if longest else None,
+                    'duration': longest.duration if longest else None
                 }
             }
         }
@@ -291,52 +325,54 @@ class SystemDashboard:
         """Print formatted dashboard to console."""
         snapshot = self.export_snapshot()
         
-        print("\n" + "="*60)
-        print("           PLAYWISE SYSTEM DASHBOARD")
-        print("="*60)
-        print(f"Snapshot Time: {snapshot['timestamp']}")
-        print("-"*60)
+        # Collect the report and print it in one call rather than line by line
+        lines = ["\n" + _RULE_60,
+                 "           PLAYWISE SYSTEM DASHBOARD",
+                 _RULE_60,
+                 f"Snapshot Time: {snapshot['timestamp']}",
+                 "-" * 60]
         
         # System Overview
-        print("\n📊 SYSTEM OVERVIEW")
+        lines.append("\n📊 SYSTEM OVERVIEW")
         overview = snapshot['system_overview']
-        print(f"  • Total Songs in Playlist: {overview['total_songs_in_playlist']}")
-        print(f"  • Total Duration: {overview['total_duration_seconds']} seconds")
-        print(f"  • Average Song Duration: {overview['average_song_duration']} seconds")
-        print(f"  • Playback History Count: {overview['total_playback_history']}")
+        lines.append(f"  • Total Songs in Playlist: {overview['total_songs_in_playlist']}")
+        lines.append(f"  • Total Duration: {overview['total_duration_seconds']} seconds")
+        lines.append(f"  • Average Song Duration: {overview['average_song_duration']} seconds")
+        lines.append(f"  • Playback History Count: {overview['total_playback_history']}")
         
         # Top 5 Longest Songs
-        print("\n🎵 TOP 5 LONGEST SONGS")
+        lines.append("\n🎵 TOP 5 LONGEST SONGS")
         if snapshot['top_5_longest_songs']:
             for idx, song in enumerate(snapshot['top_5_longest_songs'], 1):
-                print(f"  {idx}. {song['title']} by {song['artist']} - {song['duration']}s")
+                lines.append(f"  {idx}. {song['title']} by {song['artist']} - {song['duration']}s")
         else:
-            print("  No songs in playlist")
+            lines.append("  No songs in playlist")
         
         # Recently Played
-        print("\n⏮️  RECENTLY PLAYED (Most Recent First)")
+        lines.append("\n⏮️  RECENTLY PLAYED (Most Recent First)")
         if snapshot['recently_played_songs']:
             for idx, song in enumerate(snapshot['recently_played_songs'], 1):
-                print(f"  {idx}. {song['title']} by {song['artist']}")
+                lines.append(f"  {idx}. {song['title']} by {song['artist']}")
         else:
-            print("  No playback history")
+            lines.append("  No playback history")
         
         # Rating Distribution
-        print("\n⭐ SONG COUNT BY RATING")
+        lines.append("\n⭐ SONG COUNT BY RATING")
         if snapshot['song_count_by_rating']:
             for rating in sorted(snapshot['song_count_by_rating'].keys(), reverse=True):
                 count = snapshot['song_count_by_rating'][rating]
                 stars = "★" * rating
-                print(f"  {stars} ({rating}): {count} songs")
+                lines.append(f"  {stars} ({rating}): {count} songs")
         else:
-            print("  No rated songs")
+            lines.append("  No rated songs")
         
         # Extremes
-        print("\n🔝 EXTREMES")
+        lines.append("\n🔝 EXTREMES")
         extremes = snapshot['extremes']
         if extremes['shortest_song']['title']:
-            print(f"  • Shortest: {extremes['shortest_song']['title']} ({extremes['shortest_song']['duration']}s)")
+            lines.append(f"  • Shortest: {extremes['shortest_song']['title']} ({extremes['shortest_song']['duration']}s)")
         if extremes['longest_song']['title']:
-            print(f"  • Longest: {extremes['longest_song']['title']} ({extremes['longest_song']['duration']}s)")
+            lines.append(f"  • Longest: {extremes['longest_song']['title']} ({extremes['longest_song']['duration']}s)")
         
-        print("\n" + "="*60 + "\n")
+        lines.append("\n" + _RULE_60 + "\n")
+        print("\n".join(lines))
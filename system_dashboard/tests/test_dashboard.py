@@ -147,6 +147,18 @@ class TestSystemDashboard(unittest.TestCase):
         self.assertEqual(stats['longest_song'].title, "Stairway to Heaven")
         self.assertEqual(stats['longest_song'].duration, 482)
     
+    def test_statistics_use_given_songs(self):
+        """
+        Test that a passed-in playlist snapshot is used instead of the live playlist.
+        """
+        songs = [Song("Short", "A", 60), Song("Long", "B", 600)]
+        
+        stats = self.dashboard.get_playlist_statistics(songs)
+        self.assertEqual(stats['total_songs'], 2)
+        self.assertEqual(stats['longest_song'].title, "Long")
+        self.assertEqual(self.dashboard.get_total_playlist_duration(songs), 660)
+        self.assertEqual(self.dashboard.get_top_longest_songs(1, songs)[0].title, "Long")
+    
     def test_export_snapshot(self):
         """
         Test complete snapshot export with all dashboard sections.
@@ -165,6 +177,7 @@ class TestSystemDashboard(unittest.TestCase):
         overview = snapshot['system_overview']
         self.assertEqual(overview['total_songs_in_playlist'], 5)
         self.assertGreater(overview['total_duration_seconds'], 0)
+        self.assertEqual(overview['total_playback_history'], 5)
         
         # Verify top songs
         self.assertEqual(len(snapshot['top_5_longest_songs']), 5)
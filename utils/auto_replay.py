@@ -11,8 +11,18 @@ class AutoReplayManager:
 
     @staticmethod
     def top_k_calm_songs(songs, k=3):
-        calming = [s for s in songs if s.genre and AutoReplayManager.is_calm(s.genre)]
-        if not calming:
-            return []
+        # Classify each distinct genre once instead of lowercasing per song
+        is_calm = AutoReplayManager.is_calm
+        calm_by_genre = {}
 
-        return heapq.nlargest(k, calming, key=lambda s: s.play_count)
+        def calming():
+            # Single lazy pass, so songs may be any iterable (including a generator)
+            for s in songs:
+                genre = s.genre
+                calm = calm_by_genre.get(genre)
+                if calm is None:
+                    calm = calm_by_genre[genre] = is_calm(genre)
+                if calm:
+                    yield s
+
+        return heapq.nlargest(k, calming(), key=lambda s: s.play_count)
@@ -0,0 +1,38 @@
+"""
+Unit tests for the AutoReplayManager module.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from utils.auto_replay import AutoReplayManager
+from playlist.song import Song
+
+
+def _song(title, genre, play_count):
+    song = Song(title, "Artist", 200, genre=genre)
+    song.play_count = play_count
+    return song
+
+
+def test_top_k_calm_songs_by_play_count():
+    """Test that only calm genres are kept, ranked by play count."""
+    songs = [
+        _song("Jazz Night", "Jazz", 2),
+        _song("Rock Fire", "Rock", 9),
+        _song("LoFi Beats", "Lo-Fi", 5),
+        _song("No Genre", None, 7),
+        _song("Ambient Sky", "ambient", 1),
+    ]
+    
+    top = AutoReplayManager.top_k_calm_songs(songs, k=2)
+    assert [s.title for s in top] == ["LoFi Beats", "Jazz Night"]
+
+
+def test_top_k_calm_songs_accepts_iterator():
+    """Test that a one-shot iterator of songs is consumed correctly."""
+    songs = [_song("Jazz Night", "Jazz", 2), _song("Chill Out", "Chill", 4)]
+    
+    top = AutoReplayManager.top_k_calm_songs(iter(songs), k=3)
+    assert [s.title for s in top] == ["Chill Out", "Jazz Night"]